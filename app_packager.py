@@ -7,34 +7,250 @@ import sys
 import platform
 import subprocess
 import shutil
+import tempfile
+import hashlib
+import argparse
+import ast
+import glob
+import importlib.util
+import pkgutil
+import io
+import json
+import lzma
+import tarfile
+import zipfile
+import urllib.error
+import urllib.request
+from contextlib import suppress
+from pathlib import Path
+
+# PyInstaller 작업 폴더는 작은 파일을 대량으로 쓰므로 가능하면 RAM 디스크(tmpfs)에 둠
+# 캐시로 재사용하기 위해 고정 경로를 사용하고 빌드 후에도 삭제하지 않음
+if os.path.isdir("/dev/shm"):
+    BUILD_DIR = "/dev/shm/btm-build"
+else:
+    BUILD_DIR = os.path.join(os.environ.get("TEMP") or tempfile.gettempdir(), "btm-build")
+DIST_DIR = "./dist"
+FINGERPRINT_FILE = os.path.join(BUILD_DIR, ".fingerprint")
+SPEC_FILE = "./BrowserTabManager.spec"
+
+# 하위 모듈까지 hidden import로 포함할 패키지 (플랫폼별 백엔드를 동적으로 임포트함)
+HIDDEN_IMPORT_PACKAGES = ("pyautogui", "pygetwindow", "orjson")
+
+# 앱에서 사용하지 않는 PySide6 모듈 (QtCore/QtGui/QtWidgets만 사용) - 번들 크기와 빌드 시간 절감
+EXCLUDED_MODULES = (
+    "PySide6.QtWebEngineCore",
+    "PySide6.QtWebEngineWidgets",
+    "PySide6.Qt3DCore",
+    "PySide6.QtMultimedia",
+    "PySide6.QtCharts",
+    "PySide6.QtQuick",
+    "PySide6.QtQml",
+    "PySide6.QtPdf",
+    "PySide6.QtTest",
+)
+
+# --cython 옵션 사용 시 C 확장 모듈로 컴파일할 모듈 (진입점인 main.py는 제외)
+CYTHON_MODULES = ("gui.py", "tab_manager.py")
+
+# UPX 압축기는 빌드 폴더와 별도로 사용자 캐시에 보관
+UPX_VERSION = "4.0.2"
+UPX_CACHE = Path(os.path.expanduser("~/.cache/browser-tab-refresher/upx"))
+UPX_PACKAGES = {
+    "Darwin": f"upx-{UPX_VERSION}-macos_x86_64",
+    "Windows": f"upx-{UPX_VERSION}-win64",
+}
 
 def install_pyinstaller():
     """PyInstaller 설치"""
     print("PyInstaller 설치 중...")
-    subprocess.call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    result = subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=False)
+    if result.returncode != 0:
+        print(f"PyInstaller 설치 실패 (종료 코드 {result.returncode})")
+
+def compute_fingerprint(cython=False):
+    """빌드 캐시 유효성 확인용 지문 계산 (의존성 목록, 패키징 옵션, Python 버전)"""
+    fingerprint = hashlib.sha256()
+    fingerprint.update(b"cython" if cython else b"python")
+    # Cython 빌드는 컴파일 모듈의 임포트 목록이 spec에 들어가므로 소스도 포함
+    paths = ["requirements.txt", os.path.abspath(__file__)]
+    if cython:
+        paths += CYTHON_MODULES
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                fingerprint.update(f.read())
+    fingerprint.update(sys.version.encode('utf-8'))
+    return fingerprint.hexdigest()
+
+def prepare_build_dir(force=False, cython=False):
+    """build 폴더 준비 - 강제 빌드이거나 지문이 달라졌을 때만 초기화"""
+    fingerprint = compute_fingerprint(cython)
+    
+    cached_fingerprint = None
+    with suppress(FileNotFoundError):
+        with open(FINGERPRINT_FILE, 'r', encoding='utf-8') as f:
+            cached_fingerprint = f.read().strip()
+    
+    if force or cached_fingerprint != fingerprint:
+        print("빌드 캐시 초기화 중...")
+        with suppress(FileNotFoundError):
+            shutil.rmtree(BUILD_DIR)
+        # 옵션이 바뀌었을 수 있으므로 spec 파일도 다시 생성
+        with suppress(FileNotFoundError):
+            os.remove(SPEC_FILE)
+    else:
+        print("이전 빌드 캐시를 재사용합니다.")
+    
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with open(FINGERPRINT_FILE, 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
 
-def package_app():
+def collect_hidden_imports():
+    """설치된 패키지와 그 하위 모듈 이름을 hidden import 목록으로 수집"""
+    hidden = ["PySide6"]
+    for package in HIDDEN_IMPORT_PACKAGES:
+        spec = importlib.util.find_spec(package)
+        if spec is None:
+            continue
+        hidden.append(package)
+        if spec.submodule_search_locations:
+            for module in pkgutil.walk_packages(spec.submodule_search_locations, prefix=package + "."):
+                hidden.append(module.name)
+    return hidden
+
+def collect_module_imports(paths):
+    """소스 파일에서 임포트하는 모듈 이름 수집 (컴파일된 확장 모듈은 PyInstaller가 분석하지 못함)"""
+    modules = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules.add(node.module)
+    
+    # 현재 플랫폼에 설치되지 않은 모듈(win32gui 등)은 제외
+    hidden = []
+    for name in sorted(modules):
+        try:
+            if importlib.util.find_spec(name) is not None:
+                hidden.append(name)
+        except (ImportError, ValueError):
+            continue
+    return hidden
+
+def compile_with_cython():
+    """CYTHON_MODULES를 제자리에서 C 확장 모듈로 컴파일, 성공 여부 반환"""
+    print("Cython으로 모듈 컴파일 중...")
+    cmd = [sys.executable, "-m", "Cython.Build.Cythonize", "-3", "-i", *CYTHON_MODULES]
+    result = subprocess.run(cmd, check=False)
+    if result.returncode != 0:
+        print(f"Cython 컴파일 실패 (종료 코드 {result.returncode}) - 일반 Python 모듈로 패키징합니다.")
+        remove_cython_artifacts()
+        return False
+    return True
+
+def remove_cython_artifacts():
+    """Cython이 생성한 .c 파일과 확장 모듈 삭제 (소스 폴더를 원래대로 유지)"""
+    for module in CYTHON_MODULES:
+        stem = os.path.splitext(module)[0]
+        for path in [f"{stem}.c", *glob.glob(f"{stem}.*.so"), *glob.glob(f"{stem}.*.pyd")]:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+
+def ensure_upx(system):
+    """UPX 압축기를 캐시에 준비하고 UPX 폴더 경로 반환 (사용할 수 없으면 None)
+    
+    캐시된 바이너리가 있으면 Last-Modified 기반 조건부 요청으로 갱신 여부만 확인
+    """
+    package = UPX_PACKAGES.get(system)
+    if package is None:
+        return None
+    
+    archive_ext = ".zip" if system == "Windows" else ".tar.xz"
+    upx_url = f"https://github.com/upx/upx/releases/download/v{UPX_VERSION}/{package}{archive_ext}"
+    binary = UPX_CACHE / ("upx.exe" if system == "Windows" else "upx")
+    meta_file = UPX_CACHE / ".meta"
+    
+    meta = {}
+    if binary.exists() and meta_file.exists():
+        try:
+            meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        except ValueError:
+            meta = {}
+    
+    headers = {}
+    if meta.get("url") == upx_url and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    
+    try:
+        request = urllib.request.Request(upx_url, headers=headers)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            print("UPX 압축기 다운로드 중...")
+            UPX_CACHE.mkdir(parents=True, exist_ok=True)
+            last_modified = response.headers.get("Last-Modified")
+            
+            # 아카이브를 디스크에 쓰지 않고 다운로드 스트림에서 바이너리만 추출
+            if system == "Windows":
+                # zip은 탐색 가능한 입력이 필요하므로 메모리에서 처리
+                with zipfile.ZipFile(io.BytesIO(response.read())) as zip_ref:
+                    binary.write_bytes(zip_ref.read(f"{package}/{binary.name}"))
+            else:
+                with lzma.open(response) as xz, tarfile.open(fileobj=xz, mode="r|") as tar:
+                    for member in tar:
+                        if member.isfile() and member.name == f"{package}/{binary.name}":
+                            binary.write_bytes(tar.extractfile(member).read())
+                            binary.chmod(0o755)
+                            break
+                    else:
+                        raise FileNotFoundError(f"{package}/{binary.name}")
+        
+        meta_file.write_text(json.dumps({"url": upx_url, "last_modified": last_modified}), encoding='utf-8')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print("캐시된 UPX 압축기를 사용합니다.")
+        else:
+            print(f"UPX 다운로드 오류 (패키징은 계속됩니다): {e}")
+    except Exception as e:
+        # 오프라인 등으로 확인할 수 없으면 캐시된 바이너리 사용
+        print(f"UPX 다운로드 오류 (패키징은 계속됩니다): {e}")
+    
+    return str(UPX_CACHE) if binary.exists() else None
+
+def package_app(force=False, cython=False):
     """앱 패키징"""
     system = platform.system()
     
-    # 임시 폴더 생성
-    os.makedirs("build", exist_ok=True)
+    # Cython 컴파일 (선택 사항) - 실패하면 일반 모듈로 계속 진행
+    if cython:
+        cython = compile_with_cython()
+    
+    # 빌드 캐시 폴더 준비
+    prepare_build_dir(force, cython)
+    
+    # UPX 압축기 준비 (더 작은 실행 파일 생성)
+    upx_dir = ensure_upx(system)
     
     # 기본 PyInstaller 옵션
     options = [
         "--name=BrowserTabManager",
         "--onefile",
         "--windowed",
-        "--clean",
         "--noconfirm",
-        # 핵심 의존성 추가
-        "--hidden-import=pyside6",
-        "--hidden-import=selenium",
-        "--hidden-import=webdriver_manager",
+        f"--workpath={BUILD_DIR}",
+        f"--distpath={DIST_DIR}",
         # 압축 최적화
-        "--upx-dir=./build" if os.path.exists("./build/upx") else "",
+        f"--upx-dir={upx_dir}" if upx_dir else "",
     ]
     
+    # 핵심 의존성 추가
+    options += [f"--hidden-import={name}" for name in collect_hidden_imports()]
+    options += [f"--exclude-module={name}" for name in EXCLUDED_MODULES]
+    if cython:
+        options += [f"--hidden-import={name}" for name in collect_module_imports(CYTHON_MODULES)]
+    
     # 시스템별 추가 옵션
     if system == "Darwin":  # macOS
         if os.path.exists("icon.icns"):
@@ -50,30 +266,24 @@ def package_app():
         elif system == "Windows":
             options.append("--add-data=tab_handles.json;.")
     
-    # UPX 압축기 다운로드 (더 작은 실행 파일 생성)
-    try:
-        if not os.path.exists("./build/upx"):
-            print("UPX 압축기 다운로드 중...")
-            if system == "Darwin":
-                upx_url = "https://github.com/upx/upx/releases/download/v4.0.2/upx-4.0.2-macos_x86_64.tar.xz"
-                subprocess.call(["curl", "-L", upx_url, "-o", "./build/upx.tar.xz"])
-                subprocess.call(["tar", "-xf", "./build/upx.tar.xz", "-C", "./build"])
-                shutil.move("./build/upx-4.0.2-macos_x86_64", "./build/upx")
-            elif system == "Windows":
-                upx_url = "https://github.com/upx/upx/releases/download/v4.0.2/upx-4.0.2-win64.zip"
-                subprocess.call(["curl", "-L", upx_url, "-o", "./build/upx.zip"])
-                import zipfile
-                with zipfile.ZipFile("./build/upx.zip", 'r') as zip_ref:
-                    zip_ref.extractall("./build")
-                shutil.move("./build/upx-4.0.2-win64", "./build/upx")
-    except Exception as e:
-        print(f"UPX 다운로드 오류 (패키징은 계속됩니다): {e}")
-    
-    # 명령 실행
-    cmd = [sys.executable, "-m", "PyInstaller"] + [opt for opt in options if opt]
-    cmd.append("main.py")
+    # 명령 실행 - spec 파일이 있으면 재사용하여 분석 결과 캐시 활용
+    if os.path.exists(SPEC_FILE):
+        cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm",
+               f"--workpath={BUILD_DIR}", f"--distpath={DIST_DIR}"]
+        # upx_dir은 spec 파일에 저장되지 않으므로 재빌드할 때도 매번 전달
+        if upx_dir:
+            cmd.append(f"--upx-dir={upx_dir}")
+        cmd.append(SPEC_FILE)
+    else:
+        cmd = [sys.executable, "-m", "PyInstaller"] + [opt for opt in options if opt]
+        cmd.append("main.py")
     print(f"명령 실행: {' '.join(cmd)}")
-    subprocess.call(cmd)
+    result = subprocess.run(cmd, check=False)
+    if cython:
+        remove_cython_artifacts()
+    if result.returncode != 0:
+        print(f"\n패키징 실패 (종료 코드 {result.returncode})")
+        return result.returncode
     
     # 결과 출력
     if system == "Darwin":
@@ -82,22 +292,24 @@ def package_app():
         print("\n패키징 완료! dist/BrowserTabManager.exe 파일이 생성되었습니다.")
     else:
         print("\n패키징 완료! dist/BrowserTabManager 파일이 생성되었습니다.")
-    
-    # 정리
-    try:
-        if os.path.exists("./build"):
-            shutil.rmtree("./build")
-        if os.path.exists("./BrowserTabManager.spec"):
-            os.remove("./BrowserTabManager.spec")
-    except:
-        pass
+    return 0
 
 if __name__ == "__main__":
-    # 필요한 경우 PyInstaller 설치
-    try:
-        import PyInstaller
-    except ImportError:
+    parser = argparse.ArgumentParser(description='Browser Tab Refresh 실행 파일 패키징')
+    parser.add_argument('--force', action='store_true',
+                        help='빌드 캐시를 무시하고 처음부터 다시 빌드')
+    parser.add_argument('--cython', action='store_true',
+                        help='gui.py와 tab_manager.py를 Cython으로 컴파일하여 패키징 (Cython과 C 컴파일러 필요)')
+    args = parser.parse_args()
+    
+    # 필요한 경우 PyInstaller 설치 (패키지를 임포트하지 않고 설치 여부만 확인)
+    if importlib.util.find_spec("PyInstaller") is None:
         install_pyinstaller()
     
+    # Cython 설치 여부 확인
+    if args.cython and importlib.util.find_spec("Cython") is None:
+        print("Cython이 설치되어 있지 않아 --cython 옵션을 무시합니다. (pip install cython)")
+        args.cython = False
+    
     # 앱 패키징
-    package_app() 
\ No newline at end of file
+    sys.exit(package_app(force=args.force, cython=args.cython))
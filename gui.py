@@ -4,21 +4,61 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QPushButton, QVBoxLayout,
                             QListWidgetItem, QMessageBox, QInputDialog, QDialog,
                             QFormLayout, QTabWidget, QStatusBar, QGroupBox,
                             QRadioButton, QButtonGroup, QProgressBar, QApplication,
-                            QTimeEdit, QScrollArea, QCheckBox)
-from PySide6.QtGui import QIcon, QKeySequence, QShortcut
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, Slot, QTime
+                            QTimeEdit, QScrollArea, QCheckBox,
+                            QListView)
+from PySide6.QtGui import QIcon, QKeySequence, QShortcut, QIntValidator
+from PySide6.QtCore import (Qt, QTimer, Signal, QObject, Slot, QTime, QRunnable, QThreadPool,
+                            QAbstractListModel, QModelIndex, QStandardPaths)
 import platform
 import sys
 import os
 import time
 import json
-import traceback
-from datetime import datetime, timedelta  # datetime과 timedelta 클래스를 직접 import
 import threading
 import random
+import atexit
+import queue
+import tempfile
 import logging
-from tab_manager import TabManager
-from time_schedule_dialog import TimeScheduleDialog
+import logging.handlers
+import heapq
+
+from tab_manager import REFRESH_SENT
+
+# 오류 로그는 큐를 거쳐 별도 스레드에서 파일에 기록 (GUI 스레드가 I/O로 막히지 않도록)
+ERROR_LOG_FILE = os.path.join(tempfile.gettempdir(), "BrowserTabManager_error.log")
+_log_queue = queue.Queue(-1)
+_log_handlers = [logging.FileHandler(ERROR_LOG_FILE, encoding="utf-8", delay=True)]
+if sys.stderr is not None:  # 콘솔 없는 패키징 빌드에서는 stderr가 없음
+    _log_handlers.append(logging.StreamHandler())
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+# 오류 로그 파일에는 경고 이상만 기록 (정보/디버그 메시지는 콘솔에만 출력)
+_log_handlers[0].setLevel(logging.WARNING)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('BrowserTabManager.gui')
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False
+
+# 목록 항목에 탭 정보를 저장하는 데이터 역할 (행마다 바인딩 속성 조회를 반복하지 않도록 한 번만 조회)
+USER_ROLE = Qt.ItemDataRole.UserRole
+
+# 스캔 결과를 재사용하는 시간 (초)
+SCAN_CACHE_TTL = 5.0
+
+# 다음 실행 때 바로 표시할 수 있도록 저장하는 스캔 결과 파일과 항목별 필드
+SCAN_CACHE_FILE_NAME = "scan_cache.json"
+SCAN_CACHE_FIELDS = ("id", "name", "title", "url")
+
+# 브라우저 선택 버튼 그룹의 버튼 ID -> 브라우저 타입
+BROWSER_TYPE_BY_BUTTON_ID = ("chrome", "firefox", "edge", "safari")
+
+# 다음 예약 시각이 멀어도 이 간격(밀리초)마다 남은 시간을 다시 계산
+MAX_SCHEDULE_CHECK_MSEC = 60 * 60 * 1000
 
 # 작업 상태 전달을 위한 시그널 클래스
 class WorkerSignals(QObject):
@@ -27,6 +67,132 @@ class WorkerSignals(QObject):
     result = Signal(object)
     progress = Signal(int)
 
+# 스캔 작업자 시그널 - 결과/종료에 스캔한 브라우저 타입을 함께 전달
+class ScanSignals(QObject):
+    finished = Signal(str)
+    error = Signal(str)
+    result = Signal(str, object)
+    progress = Signal(int)
+
+class ScannedTabsModel(QAbstractListModel):
+    """스캔된 탭 목록 모델 - 행마다 위젯 항목을 만들지 않고 창 정보 목록을 그대로 표시"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._windows = []
+        self._cached = False  # 이전 세션에 저장된 결과를 표시 중인지
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._windows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            name = self._windows[index.row()]["name"]
+            return f"{name} (캐시)" if self._cached else name
+        if role == USER_ROLE:
+            return self._windows[index.row()]
+        return None
+    
+    def set_windows(self, windows, cached=False):
+        """목록 전체 교체 (뷰는 한 번만 다시 그림)"""
+        self.beginResetModel()
+        self._windows = list(windows)
+        self._cached = cached
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_windows([])
+    
+    def window(self, row):
+        """행에 해당하는 창 정보 반환"""
+        return self._windows[row]
+
+class RefreshWorker(QRunnable):
+    """스레드 풀에서 탭 하나를 새로고침하는 작업자"""
+    def __init__(self, tab_manager, tab):
+        super().__init__()
+        self.tab_manager = tab_manager
+        self.tab = tab
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            success = self.tab_manager.refresh_tab(self.tab.id)
+        except Exception as e:
+            logger.error(f"탭 새로고침 작업 오류 (ID: {self.tab.id}): {str(e)}")
+            success = False
+        
+        self.signals.result.emit({
+            "id": self.tab.id,
+            "name": self.tab.name,
+            "browser_type": self.tab.browser_type or self.tab_manager.browser_type,
+            "success": success
+        })
+
+class BatchRefreshWorker(QRunnable):
+    """
+    스레드 풀에서 여러 탭을 한 번에 새로고침하는 작업자 (macOS)
+    TabManager.refresh_tabs_parallel이 Chrome/Edge 탭을 브라우저별 osascript 한 번으로 묶어 처리함
+    """
+    def __init__(self, tab_manager, tabs):
+        super().__init__()
+        self.tab_manager = tab_manager
+        self.tabs = tabs
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        reported = set()
+        try:
+            for result in self.tab_manager.refresh_tabs_parallel([tab.id for tab in self.tabs]):
+                reported.add(result["id"])
+                self.signals.result.emit(result)
+        except Exception as e:
+            logger.error(f"일괄 새로고침 작업 오류: {str(e)}")
+        
+        # 결과가 없는 탭은 실패로 보고 (GUI가 모든 결과를 기다리므로)
+        for tab in self.tabs:
+            if tab.id not in reported:
+                self.signals.result.emit({
+                    "id": tab.id,
+                    "name": tab.name,
+                    "browser_type": tab.browser_type or self.tab_manager.browser_type,
+                    "success": False
+                })
+
+class ScanWorker(QRunnable):
+    """스레드 풀에서 열린 브라우저 탭을 스캔하는 작업자"""
+    def __init__(self, tab_manager, browser_type):
+        super().__init__()
+        self.tab_manager = tab_manager
+        self.browser_type = browser_type
+        self.signals = ScanSignals()
+    
+    def run(self):
+        try:
+            browser_windows = self.tab_manager.get_browser_windows()
+            self.signals.progress.emit(80)
+            self.signals.result.emit(self.browser_type, browser_windows)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit(self.browser_type)
+
+class ScheduledRefreshWorker(QRunnable):
+    """스레드 풀에서 현재 시각에 예약된 탭을 확인하고 새로고침하는 작업자"""
+    def __init__(self, tab_manager):
+        super().__init__()
+        self.tab_manager = tab_manager
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            self.signals.result.emit(self.tab_manager.check_scheduled_refreshes())
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
 class TabNameDialog(QDialog):
     def __init__(self, tab_data, parent=None):
         super().__init__(parent)
@@ -76,25 +242,77 @@ class MainWindow(QMainWindow):
         # 새로고침 관련 상태 변수
         self.auto_refresh_interval = 30  # 기본값
         self.auto_refresh_enabled = False
-        self.last_refresh_time = None
+        self._last_refresh_mono = None  # 마지막 새로고침 시각 (time.monotonic)
+        self._last_refresh_str = None  # 표시용으로 한 번만 포맷한 시각 문자열
         self.time_check_active = False  # 시간 체크 타이머 활성화 상태
+        self._any_scheduled = False  # 예약된 시간이 하나라도 있는지 (_schedule_next_check에서 갱신)
+        self._next_check_due = False  # 다음 타이머가 실제 예약 시각에 맞춘 것인지
+        self._scheduled_refresh_running = False  # 예약 새로고침 작업자가 실행 중인지
+        
+        # 백그라운드 새로고침 상태
+        self.worker_pool = QThreadPool(self)
+        self.worker_pool.setMaxThreadCount(8)  # 탭 새로고침/스캔 작업자를 최대 8개까지 동시에 실행
+        # 예약 새로고침은 정확한 초에만 실행되므로 스캔/새로고침 작업 뒤에 밀리지 않도록 전용 풀 사용
+        self.schedule_pool = QThreadPool(self)
+        self.schedule_pool.setMaxThreadCount(1)
+        self.refresh_signals = WorkerSignals()
+        self.refresh_signals.finished.connect(self.on_refresh_all_finished)
+        self._pending_results = []
+        self._refresh_total = 0
+        self._show_refresh_result = True
+        self._refresh_scope = "모든"
+        self._current_browser_type = "chrome"  # 선택된 라디오 버튼 (change_browser_type에서만 갱신)
+        # (탭 ID, 브라우저 타입)별 마지막 새로고침 성공 시각 (time.monotonic)
+        # 같은 ID가 브라우저별로 있을 수 있으므로 ID만으로 구분하지 않음 (_refresh_key 참고)
+        self._tab_refreshed_at = {}
+        
+        # 예약 시간 표시 문자열 캐시 (TabManager.schedule_version 기준으로 무효화)
+        self._scheduled_text_cache = {}
+        self._schedule_summary = (None, None)
+        self._last_selection_key = None  # 마지막으로 레이블에 반영한 (선택된 탭 ID, 예약 버전)
+        self._status_update_pending = False  # 상태 레이블 갱신이 이벤트 루프에 예약되었는지
+        
+        # 브라우저 타입별 최근 스캔 결과 캐시: {브라우저 타입: (time.monotonic 시각, 결과)}
+        self._scan_cache = {}
+        # 스캔 작업이 진행 중인 브라우저 타입 (중복 스캔 방지)
+        self._scan_inflight = set()
         
         # 생성자에 현재 작업 디렉토리 로깅
-        print(f"현재 작업 디렉토리: {os.getcwd()}")
+        logger.info(f"현재 작업 디렉토리: {os.getcwd()}")
         
         # GUI 초기화
         self.init_ui()
         
         # 타이머 설정
+        # 자동 새로고침 타이머는 하나만 만들어 재사용 (간격은 setInterval로만 변경)
         self.refresh_timer = QTimer(self)
+        # 초 단위 간격이므로 정밀 타이머가 필요 없음 (Windows 타이머 해상도를 올리지 않음)
+        self.refresh_timer.setTimerType(Qt.CoarseTimer)
+        self.refresh_timer.setInterval(self.auto_refresh_interval * 1000)
         self.refresh_timer.timeout.connect(self.auto_refresh_tabs)
         
+        # 남은 시간 표시용 타이머 (창이 보이고 탭 관리 탭이 활성일 때만 동작)
+        self._label_timer = QTimer(self)
+        self._label_timer.setTimerType(Qt.CoarseTimer)
+        self._label_timer.setInterval(1000)
+        self._label_timer.timeout.connect(self._tick_label)
+        
         # 시간 기반 새로고침을 위한 타이머
+        # (주기적으로 폴링하지 않고 다음 예약 시각에 한 번만 실행)
         self.time_check_timer = QTimer(self)
+        self.time_check_timer.setSingleShot(True)
+        # 예약 시간은 초 단위로 정확히 일치해야 하므로 이 타이머만 정밀 타이머 사용
+        self.time_check_timer.setTimerType(Qt.PreciseTimer)
         self.time_check_timer.timeout.connect(self.check_scheduled_refreshes)
         
         # 한 번 새로고침 실행
-        QTimer.singleShot(1000, self.update_time_check_timer)
+        QTimer.singleShot(1000, Qt.CoarseTimer, self._schedule_next_check)
+        
+        # 이전 세션의 스캔 결과를 먼저 표시하고 백그라운드에서 다시 스캔
+        self._scan_cache_file = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), SCAN_CACHE_FILE_NAME)
+        self._saved_scans = {}  # 브라우저 타입 -> 저장된 스캔 결과
+        self._restore_scan_cache()
         
         # 최근 설정 시간과 리프레시 방지를 위한 플래그
         self.last_schedule_set_time = None
@@ -106,8 +324,8 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(main_widget)
         
         # 탭 위젯 생성
-        tab_widget = QTabWidget()
-        layout.addWidget(tab_widget)
+        self.tab_widget = QTabWidget()
+        layout.addWidget(self.tab_widget)
         
         # 관리 탭 생성
         manage_tab = QWidget()
@@ -115,6 +333,8 @@ class MainWindow(QMainWindow):
         
         # 브라우저 선택 그룹
         browser_group = QGroupBox("브라우저 선택")
+        # 스캔 중에는 브라우저를 바꾸지 못하도록 잠그기 위해 보관
+        self.browser_group = browser_group
         browser_layout = QHBoxLayout()
         self.chrome_radio = QRadioButton("Chrome")
         self.chrome_radio.setChecked(True)
@@ -123,12 +343,12 @@ class MainWindow(QMainWindow):
         self.safari_radio = QRadioButton("Safari")
         
         # 브라우저 선택 버튼 그룹 생성
+        # 버튼마다 정수 ID를 붙여 클릭 시 버튼 비교 없이 바로 브라우저 타입 조회
         browser_button_group = QButtonGroup(self)
-        browser_button_group.addButton(self.chrome_radio)
-        browser_button_group.addButton(self.firefox_radio)
-        browser_button_group.addButton(self.edge_radio)
-        browser_button_group.addButton(self.safari_radio)
-        browser_button_group.buttonClicked.connect(self.change_browser_type)
+        for button_id, radio in enumerate((self.chrome_radio, self.firefox_radio,
+                                            self.edge_radio, self.safari_radio)):
+            browser_button_group.addButton(radio, button_id)
+        browser_button_group.idClicked.connect(self.change_browser_type)
         
         browser_layout.addWidget(self.chrome_radio)
         browser_layout.addWidget(self.firefox_radio)
@@ -143,31 +363,37 @@ class MainWindow(QMainWindow):
         
         # 스캔된 탭 목록
         scan_label = QLabel("스캔된 탭:")
-        self.scanned_tabs_list = QListWidget()
-        self.scanned_tabs_list.setSelectionMode(QListWidget.ExtendedSelection)
-        self.scanned_tabs_list.itemDoubleClicked.connect(self.add_tab_from_scan)
-        self.scanned_tabs_list.setMinimumHeight(200)  # 최소 높이 증가
+        self.scanned_tabs_model = ScannedTabsModel(self)
+        self.scanned_tabs_view = QListView()
+        self.scanned_tabs_view.setModel(self.scanned_tabs_model)
+        self.scanned_tabs_view.setSelectionMode(QListView.ExtendedSelection)
+        self.scanned_tabs_view.setUniformItemSizes(True)
+        self.scanned_tabs_view.doubleClicked.connect(self.add_tab_from_scan)
+        self.scanned_tabs_view.setMinimumHeight(200)  # 최소 높이 증가
         
         # 탭 관리 버튼
         btn_layout = QHBoxLayout()
-        scan_btn = QPushButton("탭 스캔")
-        scan_btn.clicked.connect(self.scan_browser_tabs)
+        self.scan_btn = QPushButton("탭 스캔")
+        self.scan_btn.setToolTip("Shift+클릭: 캐시를 무시하고 다시 스캔")
+        self.scan_btn.clicked.connect(self.scan_browser_tabs)
         add_btn = QPushButton("선택 탭 추가")
         add_btn.clicked.connect(self.add_selected_tabs)
         remove_btn = QPushButton("선택 탭 제거")
         remove_btn.clicked.connect(self.remove_selected_tab)
         
-        btn_layout.addWidget(scan_btn)
+        btn_layout.addWidget(self.scan_btn)
         btn_layout.addWidget(add_btn)
         btn_layout.addWidget(remove_btn)
         
         tabs_layout.addWidget(scan_label)
-        tabs_layout.addWidget(self.scanned_tabs_list)
+        tabs_layout.addWidget(self.scanned_tabs_view)
         tabs_layout.addLayout(btn_layout)
         
         # 관리 중인 탭 목록
         manage_label = QLabel("관리 중인 탭:")
         self.managed_tabs_list = QListWidget()
+        self._managed_row_index = {}  # (탭 ID, 브라우저 타입) -> 목록 항목 (증분 갱신용)
+        self._tabs_by_row = []  # 목록 행 순서대로의 탭 정보
         self.managed_tabs_list.setSelectionMode(QListWidget.ExtendedSelection)
         self.managed_tabs_list.setMinimumHeight(200)  # 최소 높이 증가
         
@@ -189,19 +415,21 @@ class MainWindow(QMainWindow):
         self.interval_edit = QLineEdit()
         self.interval_edit.setPlaceholderText("간격(초)")
         self.interval_edit.setText(str(self.auto_refresh_interval))
-        self.interval_edit.textChanged.connect(self.update_refresh_interval)
+        self.interval_edit.setValidator(QIntValidator(5, 86400, self))
+        # 입력을 마쳤을 때(Enter 또는 포커스 이동)만 간격 적용 - 유효한 값일 때만 발생
+        self.interval_edit.editingFinished.connect(self.update_refresh_interval)
         auto_refresh_layout.addWidget(self.auto_refresh_check)
         auto_refresh_layout.addWidget(self.interval_edit)
         refresh_layout.addLayout(auto_refresh_layout)
         
         # 수동 새로고침 버튼 추가
         manual_refresh_layout = QHBoxLayout()
-        refresh_selected_btn = QPushButton("선택한 탭 새로고침")
-        refresh_selected_btn.clicked.connect(self.refresh_selected_tabs)
-        refresh_all_btn = QPushButton("모든 탭 새로고침")
-        refresh_all_btn.clicked.connect(self.refresh_all_tabs)
-        manual_refresh_layout.addWidget(refresh_selected_btn)
-        manual_refresh_layout.addWidget(refresh_all_btn)
+        self.refresh_selected_btn = QPushButton("선택한 탭 새로고침")
+        self.refresh_selected_btn.clicked.connect(self.refresh_selected_tabs)
+        self.refresh_all_btn = QPushButton("모든 탭 새로고침")
+        self.refresh_all_btn.clicked.connect(self.refresh_all_tabs)
+        manual_refresh_layout.addWidget(self.refresh_selected_btn)
+        manual_refresh_layout.addWidget(self.refresh_all_btn)
         refresh_layout.addLayout(manual_refresh_layout)
         
         # 시간 기반 새로고침 설정
@@ -234,7 +462,8 @@ class MainWindow(QMainWindow):
         status_group.setLayout(status_layout)
         manage_layout.addWidget(status_group, stretch=1)
         
-        tab_widget.addTab(manage_tab, "탭 관리")
+        self.tab_widget.addTab(manage_tab, "탭 관리")
+        self.tab_widget.currentChanged.connect(self._update_label_timer)
         
         # 상태바 설정
         self.status_bar = self.statusBar()
@@ -258,82 +487,160 @@ class MainWindow(QMainWindow):
         """저장된 탭 정보 로드"""
         self.update_managed_tabs_list()
     
+    @Slot()
     def scan_browser_tabs(self):
-        """열린 브라우저 탭 스캔"""
-        try:
-            self.set_gui_enabled(False)
-            self.status_bar.showMessage("브라우저 탭 스캔 중...")
-            self.show_progress(30)
-            
-            # 현재 선택된 브라우저 타입 가져오기
-            browser_type = self.get_current_browser_type()
-            
-            # 브라우저 타입 설정
-            self.tab_manager.set_browser_type(browser_type)
-            
-            # 현재 열린 브라우저 창 가져오기
-            browser_windows = self.tab_manager.get_browser_windows()
-            self.show_progress(80)
-            
-            # 리스트 위젯 초기화
-            self.scanned_tabs_list.clear()
-            
-            # 탭 수 카운팅을 위한 변수
-            total_tabs = 0
-            
-            # 각 탭을 리스트에 추가
+        """열린 브라우저 탭 스캔 - 작업자를 스레드 풀에 제출
+        
+        직전 스캔 결과가 SCAN_CACHE_TTL 이내이면 재사용하고,
+        Shift+클릭 시에는 캐시를 무시하고 다시 스캔
+        """
+        # 현재 선택된 브라우저 타입 가져오기
+        browser_type = self._current_browser_type
+        
+        # 같은 브라우저를 이미 스캔 중이면 진행 중인 결과를 기다림
+        if browser_type in self._scan_inflight:
+            self.status_bar.showMessage("브라우저 탭 스캔이 이미 진행 중입니다")
+            return
+        
+        force = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        cached = self._scan_cache.get(browser_type)
+        if (not force and cached is not None
+                and time.monotonic() - cached[0] < SCAN_CACHE_TTL):
+            self.on_scan_result(browser_type, cached[1])
+            return
+        
+        self._scan_inflight.add(browser_type)
+        # 창 전체 대신 스캔 버튼과 브라우저 선택만 잠금 (스캔 중에도 나머지 GUI는 사용 가능)
+        # 스캔 도중 브라우저를 바꾸면 이전 브라우저의 결과가 새 브라우저 탭으로 추가될 수 있음
+        self.scan_btn.setEnabled(False)
+        self.browser_group.setEnabled(False)
+        self.status_bar.showMessage("브라우저 탭 스캔 중...")
+        self.show_progress(30)
+        
+        # 브라우저 타입 설정
+        self.tab_manager.set_browser_type(browser_type)
+        
+        worker = ScanWorker(self.tab_manager, browser_type)
+        # 진행 표시줄은 위에서 이미 표시했으므로 값만 갱신
+        worker.signals.progress.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        worker.signals.result.connect(self.on_scan_result)
+        worker.signals.error.connect(self.on_scan_error)
+        worker.signals.finished.connect(self.on_scan_finished)
+        self.worker_pool.start(worker)
+    
+    @Slot(str, object)
+    def on_scan_result(self, browser_type, browser_windows):
+        """스캔 결과를 목록에 표시 (browser_type은 결과를 스캔한 브라우저)"""
+        cached = self._scan_cache.get(browser_type)
+        if cached is None or browser_windows is not cached[1]:
+            # 새로 스캔한 결과만 정상화 (캐시된 결과는 이미 처리됨)
             for window in browser_windows:
-                # Safari ID 형식 확인 및 정상화
-                if browser_type == "safari":
-                    # 로깅을 추가하여 디버깅
-                    print(f"Safari 탭 정보: {window}")
-                    
-                    # ID가 있는지 확인하고 정수로 변환 가능한지 확인
-                    if "id" in window:
-                        try:
-                            window["id"] = int(window["id"])
-                        except (ValueError, TypeError):
-                            # 변환할 수 없으면 해시값 사용
-                            window["id"] = hash(str(window.get("title", ""))) % 100000
-                            print(f"Safari 탭 ID 변환됨: {window['id']}")
-                
-                item = QListWidgetItem(window["name"])
-                item.setData(Qt.UserRole, window)
-                self.scanned_tabs_list.addItem(item)
-                total_tabs += 1
-            
-            if not browser_windows:
-                self.status_bar.showMessage("열린 브라우저 창을 찾을 수 없습니다")
-            else:
-                self.status_bar.showMessage(f"{len(browser_windows)}개의 브라우저 창에서 {total_tabs}개의 탭을 찾았습니다")
-        except Exception as e:
-            self.show_error(f"브라우저 탭 스캔 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            self.hide_progress()
-            self.set_gui_enabled(True)
+                self._normalize_window_id(browser_type, window)
+            self._scan_cache[browser_type] = (time.monotonic(), browser_windows)
+            self._save_scan_cache(browser_type, browser_windows)
+        
+        # 선택된 브라우저와 다른 브라우저의 결과는 목록에 표시하지 않음 (캐시에만 보관)
+        if browser_type != self._current_browser_type:
+            return
+        
+        # 모델 데이터만 교체 (위젯 항목 생성 없음)
+        self.scanned_tabs_model.set_windows(browser_windows)
+        total_tabs = len(browser_windows)
+        
+        if not browser_windows:
+            self.status_bar.showMessage("열린 브라우저 창을 찾을 수 없습니다")
+        else:
+            self.status_bar.showMessage(f"{len(browser_windows)}개의 브라우저 창에서 {total_tabs}개의 탭을 찾았습니다")
     
-    def add_tab_from_scan(self, item):
+    def _restore_scan_cache(self):
+        """이전 세션에 저장한 스캔 결과를 표시하고 새 스캔 시작"""
+        try:
+            with open(self._scan_cache_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"스캔 캐시를 읽을 수 없습니다: {e}")
+            return
+        if not isinstance(saved, dict):
+            return
+        
+        self._saved_scans = saved
+        windows = saved.get(self._current_browser_type)
+        if not windows:
+            return
+        self.scanned_tabs_model.set_windows(windows, cached=True)
+        self.status_bar.showMessage(f"이전 스캔 결과 {len(windows)}개를 표시합니다 (다시 스캔 중...)")
+        # 창이 표시된 뒤 스레드 풀에서 실제 스캔 결과로 교체
+        QTimer.singleShot(0, self.scan_browser_tabs)
+    
+    def _save_scan_cache(self, browser_type, browser_windows):
+        """다음 실행을 위해 스캔 결과 저장 (필요한 필드만, 임시 파일에 쓴 후 원자적으로 교체)"""
+        self._saved_scans[browser_type] = [
+            {key: window[key] for key in SCAN_CACHE_FIELDS if key in window}
+            for window in browser_windows
+        ]
+        temp_file = self._scan_cache_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._scan_cache_file), exist_ok=True)
+            data_str = json.dumps(self._saved_scans, ensure_ascii=False)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(data_str)
+            os.replace(temp_file, self._scan_cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"스캔 캐시를 저장할 수 없습니다: {e}")
+    
+    @staticmethod
+    def _normalize_window_id(browser_type, window):
+        """스캔 결과의 탭 ID를 정수로 정상화 (스캔 시 한 번만 수행, 이후 단계는 그대로 사용)"""
+        if browser_type != "safari" or "id" not in window:
+            return
+        # 디버그 레벨일 때만 문자열을 만들고 기록 (탭마다 호출되는 경로)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Safari 탭 정보: {window}")
+        
+        # 정수로 변환 가능한지 확인
+        if not isinstance(window["id"], int):
+            try:
+                window["id"] = int(window["id"])
+            except (ValueError, TypeError):
+                # 변환할 수 없으면 해시값 사용
+                window["id"] = hash(str(window.get("title", ""))) % 100000
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Safari 탭 ID 변환됨: {window['id']}")
+    
+    @Slot(str)
+    def on_scan_error(self, message):
+        """스캔 작업자 오류 표시"""
+        self.report_error(f"브라우저 탭 스캔 오류: {message}")
+    
+    @Slot(str)
+    def on_scan_finished(self, browser_type):
+        """스캔 작업 종료 후 GUI 복원 (끝난 작업자가 스캔한 브라우저의 진행 표시만 해제)"""
+        self._scan_inflight.discard(browser_type)
+        self.hide_progress()
+        self.scan_btn.setEnabled(True)
+        self.browser_group.setEnabled(True)
+    
+    @Slot(QModelIndex)
+    def add_tab_from_scan(self, index):
         """스캔된 탭 목록에서 관리 탭에 추가"""
         try:
-            window = item.data(Qt.UserRole)
+            window = self.scanned_tabs_model.window(index.row())
             window_id = window["id"]
             window_name = window["name"]
             
             # 현재 선택된 브라우저 타입 가져오기
-            browser_type = self.get_current_browser_type()
+            browser_type = self._current_browser_type
             
-            # ID 형식 로깅 (디버깅용)
-            print(f"추가 시도 중인 탭: ID={window_id}, 타입={type(window_id)}, 이름={window_name}, 브라우저={browser_type}")
+            # ID 형식 로깅 (디버깅용) - ID는 스캔 시 이미 정상화됨
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"추가 시도 중인 탭: ID={window_id}, 타입={type(window_id)}, 이름={window_name}, 브라우저={browser_type}")
             
-            # Safari ID 유효성 확인
-            if browser_type == "safari" and not isinstance(window_id, int):
-                try:
-                    window_id = int(window_id)
-                except (ValueError, TypeError):
-                    window_id = hash(str(window_name)) % 100000
-                    print(f"Safari 탭 ID 해시로 변환됨: {window_id}")
+            # 이미 목록에 있는 탭은 탭 매니저를 거치지 않고 바로 거름
+            if (window_id, browser_type) in self._managed_row_index:
+                self.status_bar.showMessage(f"탭 '{window_name}'은(는) 이미 관리 중입니다")
+                return
             
             # 탭 매니저에 추가 (브라우저 타입 포함)
             if self.tab_manager.add_tab(window_id, window_name, browser_type):
@@ -342,34 +649,31 @@ class MainWindow(QMainWindow):
             else:
                 self.status_bar.showMessage(f"탭 '{window_name}'은(는) 이미 관리 중입니다")
         except Exception as e:
-            self.show_error(f"탭 추가 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.report_error(f"탭 추가 오류: {str(e)}")
     
+    @Slot()
     def add_selected_tabs(self):
         """선택한 스캔 탭들을 관리 목록에 추가"""
-        selected_items = self.scanned_tabs_list.selectedItems()
-        if not selected_items:
+        selected_rows = sorted(index.row() for index in self.scanned_tabs_view.selectionModel().selectedRows())
+        if not selected_rows:
             self.status_bar.showMessage("추가할 탭을 선택하세요")
             return
         
         # 현재 선택된 브라우저 타입 가져오기
-        browser_type = self.get_current_browser_type()
+        browser_type = self._current_browser_type
         
         added_count = 0
         failed_count = 0
-        for item in selected_items:
+        for row in selected_rows:
             try:
-                window = item.data(Qt.UserRole)
+                window = self.scanned_tabs_model.window(row)
                 window_id = window["id"]
                 window_name = window["name"]
                 
-                # Safari ID 유효성 확인
-                if browser_type == "safari" and not isinstance(window_id, int):
-                    try:
-                        window_id = int(window_id)
-                    except (ValueError, TypeError):
-                        window_id = hash(str(window_name)) % 100000
+                # 이미 관리 중인 탭은 (ID, 브라우저 타입) 색인으로 바로 거름
+                if (window_id, browser_type) in self._managed_row_index:
+                    failed_count += 1
+                    continue
                 
                 if self.tab_manager.add_tab(window_id, window_name, browser_type):
                     added_count += 1
@@ -377,9 +681,7 @@ class MainWindow(QMainWindow):
                     failed_count += 1
             except Exception as e:
                 failed_count += 1
-                print(f"탭 추가 중 오류: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"탭 추가 중 오류: {e}")
         
         if added_count > 0:
             self.status_bar.showMessage(f"{added_count}개의 탭이 추가되었습니다 (브라우저: {browser_type})")
@@ -388,70 +690,126 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("선택한 탭이 이미 모두 관리 중이거나 추가할 수 없습니다")
         
         if failed_count > 0:
-            print(f"{failed_count}개의 탭을 추가하지 못했습니다.")
+            logger.info(f"{failed_count}개의 탭을 추가하지 못했습니다.")
     
-    def change_browser_type(self, button):
+    @Slot(int)
+    def change_browser_type(self, button_id):
         """브라우저 타입 변경"""
-        browser_type = "chrome"
-        if button == self.firefox_radio:
-            browser_type = "firefox"
-        elif button == self.edge_radio:
-            browser_type = "edge"
-        elif button == self.safari_radio:
-            browser_type = "safari"
-            
+        browser_type = BROWSER_TYPE_BY_BUTTON_ID[button_id]
+        self._current_browser_type = browser_type
+        
         if self.tab_manager.set_browser_type(browser_type):
             self.status_bar.showMessage(f"브라우저 타입이 {browser_type.capitalize()}로 변경되었습니다")
-            self.scanned_tabs_list.clear()  # 스캔된 탭 목록 초기화
+            self.scanned_tabs_model.clear()  # 스캔된 탭 목록 초기화
+            self._scan_cache.pop(browser_type, None)  # 새 브라우저는 항상 다시 스캔
     
     def update_managed_tabs_list(self):
-        """관리 중인 탭 목록 업데이트"""
-        self.managed_tabs_list.clear()
-        for tab in self.tab_manager.managed_tabs:
-            # 브라우저 타입 정보를 포함한 표시
-            browser_type = tab.get('browser_type', '알 수 없음')
-            display_name = f"{tab['name']} [{browser_type}]"
+        """관리 중인 탭 목록 업데이트 - 바뀐 행만 추가/삭제/이름 변경"""
+        index = self._managed_row_index
+        tabs = self.tab_manager.managed_tabs
+        # 같은 ID가 브라우저별로 있을 수 있으므로 (ID, 브라우저 타입)을 키로 사용
+        current_keys = {(tab.id, tab.browser_type) for tab in tabs}
+        
+        # 다시 그리기와 시그널을 멈춘 상태에서 목록 갱신
+        self.managed_tabs_list.setUpdatesEnabled(False)
+        self.managed_tabs_list.blockSignals(True)
+        try:
+            # 더 이상 관리하지 않는 탭의 행 제거
+            for key in [key for key in index if key not in current_keys]:
+                item = index.pop(key)
+                self.managed_tabs_list.takeItem(self.managed_tabs_list.row(item))
             
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.UserRole, tab['id'])
-            # 브라우저 타입에 따른 아이콘 또는 색상 설정
-            self.managed_tabs_list.addItem(item)
+            for position, tab in enumerate(tabs):
+                # 브라우저 타입 정보를 포함한 표시
+                browser_type = tab.browser_type or '알 수 없음'
+                display_name = f"{tab.name} [{browser_type}]"
+                
+                key = (tab.id, tab.browser_type)
+                item = index.get(key)
+                if item is None:
+                    item = QListWidgetItem(display_name)
+                    item.setData(USER_ROLE, tab.id)
+                    index[key] = item
+                    self.managed_tabs_list.insertItem(position, item)
+                    continue
+                
+                # 순서가 바뀐 경우에만 행 이동 (선택 상태 유지)
+                # 제자리인지 먼저 확인하여 대부분의 행에서 row()의 선형 검색을 피함
+                if self.managed_tabs_list.item(position) is not item:
+                    selected = item.isSelected()
+                    self.managed_tabs_list.takeItem(self.managed_tabs_list.row(item))
+                    self.managed_tabs_list.insertItem(position, item)
+                    item.setSelected(selected)
+                if item.text() != display_name:
+                    item.setText(display_name)
+            
+            # 행 번호 -> 탭 정보 (선택 항목 조회 시 QVariant 변환을 피하기 위함)
+            self._tabs_by_row = list(tabs)
+        finally:
+            self.managed_tabs_list.blockSignals(False)
+            self.managed_tabs_list.setUpdatesEnabled(True)
+            self.managed_tabs_list.viewport().update()
     
+    def _tab_for_item(self, item):
+        """관리 탭 목록 항목에 해당하는 탭 정보 반환"""
+        return self._tabs_by_row[self.managed_tabs_list.row(item)]
+    
+    @Slot(int)
     def toggle_auto_refresh(self, checked):
         """자동 새로고침 토글"""
         self.auto_refresh_enabled = checked
         if checked:
-            try:
-                interval = int(self.interval_edit.text())
-                if interval < 5:
-                    interval = 5
-                    self.interval_edit.setText("5")
-                self.auto_refresh_interval = interval
-                self.refresh_timer.start(interval * 1000)
-                self.status_bar.showMessage(f"자동 새로고침 활성화 ({interval}초 간격)")
-            except ValueError:
+            # 검증기(5~86400)를 통과한 값만 사용하고, 입력 중인 값이면 현재 간격으로 되돌림
+            interval = self._interval_from_edit()
+            if interval is not None:
+                self._set_refresh_interval(interval)
+            else:
                 self.interval_edit.setText(str(self.auto_refresh_interval))
-                self.refresh_timer.start(self.auto_refresh_interval * 1000)
-                self.status_bar.showMessage(f"자동 새로고침 활성화 ({self.auto_refresh_interval}초 간격)")
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start()
+            self.status_bar.showMessage(f"자동 새로고침 활성화 ({self.auto_refresh_interval}초 간격)")
         else:
             self.refresh_timer.stop()
             self.status_bar.showMessage("자동 새로고침 비활성화")
-        self.update_status_labels()
+        self._update_timing_labels()
+        self._update_label_timer()
+    
+    def _interval_from_edit(self):
+        """
+        간격 입력란의 값을 정수로 변환 (검증기를 통과하지 못했거나 변환할 수 없으면 None)
+        QIntValidator는 로캘의 자릿수 구분 기호(예: "1,000")를 허용하므로 int() 대신 로캘로 변환
+        """
+        if not self.interval_edit.hasAcceptableInput():
+            return None
+        interval, ok = self.interval_edit.validator().locale().toInt(self.interval_edit.text())
+        return interval if ok else None
     
+    def _set_refresh_interval(self, interval):
+        """자동 새로고침 간격 변경 - 값이 바뀐 경우에만 타이머에 반영"""
+        if interval == self.auto_refresh_interval and self.refresh_timer.interval() == interval * 1000:
+            return
+        self.auto_refresh_interval = interval
+        self.refresh_timer.setInterval(interval * 1000)
+    
+    @Slot()
     def update_refresh_interval(self):
         """새로고침 간격 업데이트"""
         if not self.auto_refresh_enabled:
             return
-        try:
-            interval = int(self.interval_edit.text())
-            if interval < 5:
-                return
-            self.auto_refresh_interval = interval
-            self.refresh_timer.start(interval * 1000)
-            self.update_status_labels()
-        except ValueError:
-            pass
+        # editingFinished는 검증기(5~86400)를 통과한 입력에서만 발생하지만, 변환에 실패하면 이전 값으로 되돌림
+        interval = self._interval_from_edit()
+        if interval is None:
+            self.interval_edit.setText(str(self.auto_refresh_interval))
+            return
+        # 값이 그대로면 아무것도 하지 않음 (포커스만 이동한 경우)
+        if interval == self.auto_refresh_interval:
+            return
+        self._set_refresh_interval(interval)
+        # 간격은 남은 시간 표시에만 영향을 주므로 예약 정보는 다시 계산하지 않음
+        self._tick_label()
+        self._update_label_timer()
     
+    @Slot()
     def auto_refresh_tabs(self):
         """자동 새로고침 실행"""
         if self.auto_refresh_enabled:
@@ -459,97 +817,146 @@ class MainWindow(QMainWindow):
                 # 자동 새로고침 상태 표시
                 self.status_bar.showMessage("자동 새로고침 실행 중...")
                 
-                # 자동 새로고침 시 선택된 탭 상관없이 모든 탭 새로고침 실행
-                self.refresh_all_tabs(show_result=True)
+                # 자동 새로고침 시 선택된 탭 상관없이 모든 탭 대상이지만,
+                # 주기의 절반 안에 이미 새로고침된 탭(수동/예약)은 이번에는 건너뜀
+                now = time.monotonic()
+                min_age = self.auto_refresh_interval / 2
+                tabs = [tab for tab in self.tab_manager.managed_tabs
+                        if now - self._tab_refreshed_at.get(self._refresh_key(tab.id, tab.browser_type),
+                                                            float("-inf")) >= min_age]
+                if not tabs and self.tab_manager.managed_tabs:
+                    self.status_bar.showMessage("최근에 새로고침된 탭만 있어 자동 새로고침을 건너뜁니다")
+                    return
+                self.refresh_all_tabs(show_result=True, tabs=tabs)
             except Exception as e:
                 self.status_bar.showMessage(f"자동 새로고침 오류: {str(e)}")
-                logging.error(f"자동 새로고침 오류: {str(e)}")
+                logger.error(f"자동 새로고침 오류: {str(e)}")
+    
+    @Slot()
+    def refresh_all_tabs(self, show_result=True, tabs=None, selected=False):
+        """모든 탭(또는 지정한 탭) 새로고침 - 탭마다 작업자를 스레드 풀에 제출"""
+        if self._refresh_total:
+            self.status_bar.showMessage("이미 새로고침이 진행 중입니다")
+            return
+        
+        tabs = list(self.tab_manager.managed_tabs if tabs is None else tabs)
+        if not tabs:
+            self.status_bar.showMessage("새로고침할 탭이 없습니다")
+            return
+        
+        self.set_refresh_buttons_enabled(False)
+        scope = "선택한" if selected else "모든"
+        self.status_bar.showMessage(f"{scope} 탭 새로고침 중... ({len(tabs)}개)")
+        self.show_progress(0)
+        
+        self._pending_results = []
+        self._refresh_total = len(tabs)
+        self._show_refresh_result = show_result
+        self._refresh_scope = scope
+        
+        # macOS에서는 탭마다 osascript를 띄우지 않도록 작업자 하나가 브라우저별로 묶어 새로고침
+        if self.tab_manager.system == "Darwin":
+            worker = BatchRefreshWorker(self.tab_manager, tabs)
+            worker.signals.result.connect(self.on_tab_refreshed)
+            self.worker_pool.start(worker)
+            return
+        
+        # 탭 수만큼(최대 8개) 작업자를 동시에 실행
+        for tab in tabs:
+            worker = RefreshWorker(self.tab_manager, tab)
+            worker.signals.result.connect(self.on_tab_refreshed)
+            self.worker_pool.start(worker)
+    
+    @Slot(object)
+    def on_tab_refreshed(self, result):
+        """작업자의 새로고침 결과 수집 (GUI 스레드에서 실행)"""
+        self._pending_results.append(result)
+        # 키 메시지만 보낸 탭(REFRESH_SENT)은 실제로 새로고침됐는지 알 수 없으므로 최근 새로고침으로 기록하지 않음
+        if result["success"] is True:
+            self._tab_refreshed_at[self._refresh_key(result["id"], result["browser_type"])] = time.monotonic()
+        self.show_progress(len(self._pending_results) * 100 // self._refresh_total)
+        
+        if len(self._pending_results) == self._refresh_total:
+            self.refresh_signals.finished.emit()
     
-    def refresh_all_tabs(self, show_result=True):
-        """모든 탭 새로고침"""
+    @Slot()
+    def on_refresh_all_finished(self):
+        """모든 작업자가 끝나면 결과 표시"""
+        results = self._pending_results
+        self._pending_results = []
+        self._refresh_total = 0
+        
         try:
-            self.set_gui_enabled(False)
-            if not self.tab_manager.managed_tabs:
-                self.status_bar.showMessage("새로고침할 탭이 없습니다")
-                return
-            
-            self.status_bar.showMessage("모든 탭 새로고침 중...")
-            self.show_progress(50)
-            
-            results = self.tab_manager.refresh_all_tabs()
-            success_count = sum(1 for r in results if r["success"])
-            
-            if success_count == len(results):
-                self.status_bar.showMessage(f"모든 탭 새로고침 완료 ({success_count}개)")
-            else:
-                self.status_bar.showMessage(f"{len(results)}개 중 {success_count}개 탭 새로고침 완료")
+            if self._show_refresh_result:
+                success_count, sent_count, failed = self._summarize(results)
+                sent_note = f", 키 전송만 확인: {sent_count}개" if sent_count else ""
+                if not failed:
+                    self.status_bar.showMessage(f"{self._refresh_scope} 탭 새로고침 완료 "
+                                                f"({success_count}개{sent_note})")
+                else:
+                    self.status_bar.showMessage(f"{len(results)}개 중 {success_count}개 탭 새로고침 완료{sent_note} "
+                                                f"(실패: {', '.join(failed)})")
             
             self.update_last_refresh_time()
         except Exception as e:
-            self.show_error(f"새로고침 오류: {str(e)}")
+            self.report_error(f"새로고침 오류: {str(e)}")
         finally:
             self.hide_progress()
-            self.set_gui_enabled(True)
+            self.set_refresh_buttons_enabled(True)
             
+    def _refresh_key(self, tab_id, browser_type):
+        """_tab_refreshed_at의 키 (브라우저 타입이 없는 탭은 현재 기본 브라우저로 간주, 결과 dict와 동일)"""
+        return (tab_id, browser_type or self.tab_manager.browser_type)
+    
+    @staticmethod
+    def _summarize(results):
+        """새로고침 결과를 한 번 순회하여 성공 개수, 키 전송만 된 개수, 실패한 탭 이름 목록 반환"""
+        success_count = 0
+        sent_count = 0
+        failed = []
+        for r in results:
+            if r["success"] == REFRESH_SENT:
+                sent_count += 1
+            elif r["success"]:
+                success_count += 1
+            else:
+                failed.append(r["name"])
+        return success_count, sent_count, failed
+    
+    @Slot()
     def refresh_selected_tabs(self, show_result=True):
-        """선택된 탭만 새로고침 - 병렬 처리 방식"""
-        try:
-            selected_items = self.managed_tabs_list.selectedItems()
-            if not selected_items:
-                self.status_bar.showMessage("새로고침할 탭을 선택하세요")
-                return
-            
-            self.set_gui_enabled(False)
-            self.status_bar.showMessage(f"선택한 {len(selected_items)}개 탭 병렬 새로고침 중...")
-            self.show_progress(50)
-            
-            # 병렬 처리를 위한 준비
-            tab_ids = []
-            for item in selected_items:
-                tab_id = item.data(Qt.UserRole)
-                tab_ids.append(tab_id)
-            
-            # 병렬 처리 실행
-            results = self.tab_manager.refresh_tabs_parallel(tab_ids)
-            
-            if show_result:
-                success_count = sum(1 for r in results if r["success"])
-                if success_count == len(results):
-                    self.status_bar.showMessage(f"선택한 {len(results)}개 탭 모두 병렬 새로고침 완료")
-                else:
-                    self.status_bar.showMessage(f"{len(results)}개 중 {success_count}개 탭 병렬 새로고침 완료")
-            
-            # 마지막 새로고침 시간 업데이트
-            self.update_last_refresh_time()
-            
-        except Exception as e:
-            self.show_error(f"새로고침 오류: {str(e)}")
-        finally:
-            self.hide_progress()
-            self.set_gui_enabled(True)
+        """선택된 탭만 새로고침 - 모든 탭 새로고침과 같은 작업자 경로 사용"""
+        if not self._has_managed_selection():
+            self.status_bar.showMessage("새로고침할 탭을 선택하세요")
+            return
+        selected_items = self.managed_tabs_list.selectedItems()
+        
+        tabs = [self._tab_for_item(item) for item in selected_items]
+        self.refresh_all_tabs(show_result=show_result, tabs=tabs, selected=True)
     
     def quick_refresh_all(self):
         """빠른 새로고침 실행 - command line 실행에서 호출됨 (병렬 처리)"""
         # 시간 기반 새로고침이나 자동 새로고침에는 항상 모든 탭 새로고침
         self.refresh_all_tabs(show_result=True)
     
+    @Slot(int)
     def toggle_time_refresh(self, checked):
         """시간 기반 새로고침 토글"""
         if checked:
             self.show_time_schedule_dialog()
         else:
             # 선택된 탭들만 예약 시간 제거
-            selected_items = self.managed_tabs_list.selectedItems()
-            if selected_items:
-                for item in selected_items:
-                    tab_id = item.data(Qt.UserRole)
+            if self._has_managed_selection():
+                for item in self.managed_tabs_list.selectedItems():
+                    tab_id = self._tab_for_item(item).id
                     self.tab_manager.remove_scheduled_refresh(tab_id)
                 self.status_bar.showMessage("선택된 탭의 예약된 새로고침이 취소되었습니다.")
             
-            self.update_status_labels()
+            self._request_status_update()
             # 시간 체크 타이머 상태 업데이트
-            self.update_time_check_timer()
+            self._schedule_next_check()
     
+    @Slot()
     def show_time_schedule_dialog(self):
         """선택된 탭에 대한 시간 예약 대화상자 표시"""
         selected_tab_ids = self.get_selected_tab_ids()
@@ -557,7 +964,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "선택 오류", "하나 이상의 탭을 선택해주세요.")
             return
 
-        # 시간 스케줄 대화상자 생성
+        # 시간 스케줄 대화상자 생성 (처음 열 때 모듈 로드)
+        from time_schedule_dialog import TimeScheduleDialog
         dialog = TimeScheduleDialog(parent=self)
         
         # 선택된 탭의 기존 일정이 있으면 대화상자에 표시
@@ -594,168 +1002,262 @@ class MainWindow(QMainWindow):
                     self.tab_manager.add_refresh_time(tab_id, time_str)
             
             # 상태 레이블 업데이트
-            self.update_status_labels()
+            self._request_status_update()
             
             # 시간 체크 타이머 상태 업데이트
-            self.update_time_check_timer()
+            self._schedule_next_check()
     
+    @Slot()
     def check_scheduled_refreshes(self):
         """
         현재 시간에 예약된 새로고침이 있는지 확인하고 있으면 실행
+        (새로고침은 작업자 스레드에서 실행하여 이벤트 루프를 막지 않음)
         """
-        try:
-            # 선택된 탭과 관계없이 모든 예약된 탭을 새로고침
-            refreshed_tabs = self.tab_manager.check_scheduled_refreshes()
-            
-            if refreshed_tabs:
-                # 새로고침 된 탭이 있으면 상태 표시줄 업데이트
-                refreshed_tabs_str = ", ".join([f"{tab_id}" for tab_id in refreshed_tabs])
-                self.status_bar.showMessage(f"예약된 새로고침 완료: 탭 {refreshed_tabs_str}", 5000)
-                # 상태 레이블 업데이트
-                self.update_status_labels()
-                # 마지막 새로고침 시간 업데이트
-                self.update_last_refresh_time()
-                # 시간 체크 타이머 상태 업데이트 - 새로고침 후 예약된 시간이 변경됐을 수 있음
-                self.update_time_check_timer()
-        except Exception as e:
-            self.status_bar.showMessage(f"예약된 새로고침 오류: {str(e)}", 3000)
-            logging.error(f"예약된 새로고침 오류: {str(e)}")
+        if self._scheduled_refresh_running:
+            # 이전 예약 새로고침이 끝나면 그때 타이머를 다시 설정함
+            return
+        
+        # 예약이 없거나, 최대 대기 시간 때문에 깨어난 경우에는 확인 없이 타이머만 재설정
+        if not self._any_scheduled or not self._next_check_due:
+            self._schedule_next_check()
+            return
+        
+        self._scheduled_refresh_running = True
+        worker = ScheduledRefreshWorker(self.tab_manager)
+        worker.signals.result.connect(self.on_scheduled_refreshed)
+        worker.signals.error.connect(self.on_scheduled_refresh_error)
+        worker.signals.finished.connect(self.on_scheduled_refresh_finished)
+        self.schedule_pool.start(worker)
+    
+    @Slot(object)
+    def on_scheduled_refreshed(self, refreshed_tabs):
+        """예약 새로고침 결과 표시 (GUI 스레드에서 실행)"""
+        if not refreshed_tabs:
+            return
+        now = time.monotonic()
+        for tab_id in refreshed_tabs:
+            # 예약 새로고침은 ID 색인(같은 ID면 목록에서 먼저 나온 탭)으로 탭을 찾으므로 같은 방식으로 브라우저 확인
+            tab = self.tab_manager.get_tab_by_id(tab_id)
+            self._tab_refreshed_at[self._refresh_key(tab_id, tab.browser_type if tab else None)] = now
+        # 새로고침 된 탭이 있으면 상태 표시줄 업데이트
+        refreshed_tabs_str = ", ".join(map(str, refreshed_tabs))
+        self.status_bar.showMessage(f"예약된 새로고침 완료: 탭 {refreshed_tabs_str}", 5000)
+        # 상태 레이블 업데이트
+        self._request_status_update()
+        # 마지막 새로고침 시간 업데이트
+        self.update_last_refresh_time()
+    
+    @Slot(str)
+    def on_scheduled_refresh_error(self, error_msg):
+        """예약 새로고침 작업자 오류 표시"""
+        self.status_bar.showMessage(f"예약된 새로고침 오류: {error_msg}", 3000)
+        logger.error(f"예약된 새로고침 오류: {error_msg}")
+    
+    @Slot()
+    def on_scheduled_refresh_finished(self):
+        """다음 예약 시각에 맞춰 타이머 재설정 - 일회성 시간이 제거됐을 수 있음"""
+        self._scheduled_refresh_running = False
+        self._schedule_next_check()
     
-    def update_time_check_timer(self):
+    def _schedule_next_check(self):
         """
-        시간 체크 타이머의 활성화 상태를 업데이트
-        예약된 시간이 있을 때만 타이머 활성화
+        다음 예약 시각에 맞춰 시간 체크 타이머를 한 번만 실행되도록 설정
+        예약된 시간이 없으면 타이머 중지
         """
-        # 모든 탭의 예약된 시간 확인
-        has_scheduled_times = False
-        
-        # 스케줄 확인
-        for tab in self.tab_manager.managed_tabs:
-            tab_id = tab["id"]
-            times = self.tab_manager.get_scheduled_refreshes(tab_id)
-            if times and len(times) > 0:
-                has_scheduled_times = True
-                break
-        
-        # 예약된 시간이 있으면 타이머 시작, 없으면 중지
-        if has_scheduled_times and not self.time_check_timer.isActive():
-            print("예약된 시간이 있어 시간 체크 타이머를 시작합니다.")
-            self.time_check_timer.start(500)  # 0.5초마다 체크하여 정확도 향상
-            self.time_check_active = True
-        elif not has_scheduled_times and self.time_check_timer.isActive():
-            print("예약된 시간이 없어 시간 체크 타이머를 중지합니다.")
-            self.time_check_timer.stop()
+        seconds = self.tab_manager.seconds_until_next_scheduled_refresh()
+        self._any_scheduled = seconds is not None
+        if seconds is None:
+            if self.time_check_timer.isActive():
+                logger.info("예약된 시간이 없어 시간 체크 타이머를 중지합니다.")
+                self.time_check_timer.stop()
             self.time_check_active = False
+            return
+        
+        # 시계 변경이나 절전 복귀에 대비해 최대 1시간 후에는 다시 계산
+        msec = max(0, int(seconds * 1000))
+        self._next_check_due = msec <= MAX_SCHEDULE_CHECK_MSEC
+        self.time_check_timer.start(min(msec, MAX_SCHEDULE_CHECK_MSEC))
+        self.time_check_active = True
     
     def update_last_refresh_time(self):
         """마지막 새로고침 시간 업데이트"""
-        self.last_refresh_time = datetime.now()
-        self.update_status_labels()
+        self._last_refresh_mono = time.monotonic()
+        self._last_refresh_str = QTime.currentTime().toString("HH:mm:ss")
+        # 새로고침 시각은 시간 관련 레이블에만 영향을 주므로 선택/예약 정보는 그대로 둠
+        self._update_timing_labels()
     
     def update_status_labels(self):
         """상태 레이블 업데이트"""
-        if self.auto_refresh_enabled:
-            next_refresh = datetime.now() + timedelta(seconds=self.auto_refresh_interval)
-            self.next_refresh_label.setText(f"다음 새로고침: {next_refresh.strftime('%H:%M:%S')}")
-        else:
-            self.next_refresh_label.setText("다음 새로고침: 비활성")
+        self._update_timing_labels()
         
-        if self.last_refresh_time:
-            self.last_refresh_label.setText(f"마지막 새로고침: {self.last_refresh_time.strftime('%H:%M:%S')}")
-        else:
-            self.last_refresh_label.setText("마지막 새로고침: 없음")
+        # 선택과 예약 정보가 그대로면 선택 관련 레이블은 다시 계산하지 않음
+        # (선택이 없으면 선택 항목 목록을 만들지 않음)
+        selected_items = self.managed_tabs_list.selectedItems() if self._has_managed_selection() else []
+        selected_ids = tuple(self._tab_for_item(item).id for item in selected_items)
+        selection_key = (selected_ids, self.tab_manager.schedule_version)
+        if selection_key != self._last_selection_key:
+            self._last_selection_key = selection_key
+            self._update_selection_labels(selected_items, selected_ids)
         
-        selected_items = self.managed_tabs_list.selectedItems()
-        if selected_items:
-            tab_info = []
-            scheduled_times = set()
-            
-            for item in selected_items:
-                tab_id = item.data(Qt.UserRole)
-                tab_name = item.text()
-                tab_info.append(tab_name)
-                times = self.tab_manager.get_scheduled_refreshes(tab_id)
-                # 문자열인 시간만 추가
-                for t in times:
-                    if isinstance(t, str):
-                        scheduled_times.add(t)
-            
-            self.selected_tab_info.setText(f"선택된 탭: {', '.join(tab_info)}")
-            
-            if scheduled_times:
-                # 일반 시간과 반복 시간 분리
-                regular_times = []
-                repeating_times = []
-                
-                for t in scheduled_times:
-                    if t.startswith("*"):
-                        # 반복 시간은 "* HH:MM:SS (매일)" 형식으로 표시
-                        repeating_times.append(f"* {t[1:]} (매일)")
-                    else:
-                        regular_times.append(t)
-                
-                # 각각 정렬
-                regular_times.sort()
-                repeating_times.sort()
-                
-                # 시간 목록 표시 (일반 시간 먼저, 그 다음 반복 시간)
-                all_times_display = regular_times + repeating_times
-                self.scheduled_times_label.setText(f"예약된 시간: {', '.join(all_times_display)}")
-                
-                # 시간 체크 플래그 업데이트
-                if not self.time_check_active:
-                    self.update_time_check_timer()
-            else:
-                self.scheduled_times_label.setText("예약된 시간: 없음")
+        # 상태바에 전체 예약 시간 표시 (디버그용)
+        status_msg = self._schedule_summary_text()
+        if status_msg:
+            self.status_bar.showMessage(status_msg, 3000)
+    
+    def _request_status_update(self):
+        """상태 레이블 갱신 예약 - 같은 이벤트 루프 반복 안의 여러 요청을 한 번으로 합침"""
+        if self._status_update_pending:
+            return
+        self._status_update_pending = True
+        QTimer.singleShot(0, self._flush_status_update)
+    
+    @Slot()
+    def _flush_status_update(self):
+        """예약된 상태 레이블 갱신 실행"""
+        self._status_update_pending = False
+        self.update_status_labels()
+    
+    def _update_timing_labels(self):
+        """다음/마지막 새로고침 시간 레이블 갱신"""
+        self._tick_label()
+        
+        if self._last_refresh_str:
+            self._set_label_text(self.last_refresh_label, f"마지막 새로고침: {self._last_refresh_str}")
         else:
-            self.selected_tab_info.setText("선택된 탭: 없음")
-            self.scheduled_times_label.setText("예약된 시간: 탭을 선택하세요")
+            self._set_label_text(self.last_refresh_label, "마지막 새로고침: 없음")
+    
+    def _update_selection_labels(self, selected_items, selected_ids):
+        """선택된 탭 정보와 예약 시간 레이블 갱신"""
+        if not selected_items:
+            self._set_label_text(self.selected_tab_info, "선택된 탭: 없음")
+            self._set_label_text(self.scheduled_times_label, "예약된 시간: 탭을 선택하세요")
+            return
         
-        # 모든 탭에 대한 예약 시간 갱신 (타이머 업데이트용)
-        all_scheduled_times = []
-        repeating_count = 0
-        one_time_count = 0
+        self._set_label_text(self.selected_tab_info,
+                             f"선택된 탭: {', '.join(item.text() for item in selected_items)}")
+        
+        scheduled_text = self._scheduled_times_text(selected_ids)
+        if not scheduled_text:
+            self._set_label_text(self.scheduled_times_label, "예약된 시간: 없음")
+            return
+        
+        self._set_label_text(self.scheduled_times_label, f"예약된 시간: {scheduled_text}")
+        # 시간 체크 플래그 업데이트
+        if not self.time_check_active:
+            self._schedule_next_check()
+    
+    @staticmethod
+    def _set_label_text(label, text):
+        """텍스트가 바뀐 경우에만 레이블 갱신"""
+        if label.text() != text:
+            label.setText(text)
+    
+    def _scheduled_times_text(self, tab_ids):
+        """선택된 탭들의 예약 시간 표시 문자열 (예약 정보가 바뀔 때만 다시 정렬/결합)"""
+        key = (tab_ids, self.tab_manager.schedule_version)
+        cached = self._scheduled_text_cache.get(key)
+        if cached is not None:
+            return cached
         
+        # 탭별로 이미 정렬된 목록(일반 시간 먼저, 그 다음 반복 시간)을 병합하며 한 번만 순회
+        parts = []
+        previous = None
+        for scheduled in heapq.merge(*(self.tab_manager.get_sorted_scheduled_times(tab_id)
+                                       for tab_id in tab_ids)):
+            dedupe_key = (scheduled.repeating, scheduled.clock)
+            if dedupe_key == previous:  # 여러 탭에 같은 시간이 있으면 한 번만 표시
+                continue
+            previous = dedupe_key
+            # 반복 시간은 "* HH:MM:SS (매일)" 형식으로 표시
+            parts.append(f"* {scheduled.clock} (매일)" if scheduled.repeating else scheduled.clock)
+        text = ", ".join(parts)
+        
+        # 이전 버전의 캐시는 더 이상 쓰이지 않으므로 비움
+        if any(v != self.tab_manager.schedule_version for _, v in self._scheduled_text_cache):
+            self._scheduled_text_cache.clear()
+        self._scheduled_text_cache[key] = text
+        return text
+    
+    def _schedule_summary_text(self):
+        """전체 탭의 예약 개수 요약 문자열 (예약 정보가 바뀔 때만 다시 계산)"""
+        version = self.tab_manager.schedule_version
+        if self._schedule_summary[0] == version:
+            return self._schedule_summary[1]
+        
+        total_count = 0
+        repeating_count = 0
         for tab in self.tab_manager.managed_tabs:
-            tab_id = tab["id"]
-            times = self.tab_manager.get_scheduled_refreshes(tab_id)
-            if times:
-                for t in times:
-                    all_scheduled_times.append(t)
-                    if isinstance(t, str) and t.startswith("*"):
-                        repeating_count += 1
-                    else:
-                        one_time_count += 1
+            for scheduled in self.tab_manager.get_sorted_scheduled_times(tab.id):
+                total_count += 1
+                if scheduled.repeating:
+                    repeating_count += 1
         
-        # 상태바에 전체 예약 시간 표시 (디버그용)
-        if all_scheduled_times:
-            status_msg = f"전체 {len(self.tab_manager.managed_tabs)}개 탭, {len(all_scheduled_times)}개 예약됨"
+        status_msg = None
+        if total_count:
+            status_msg = f"전체 {len(self.tab_manager.managed_tabs)}개 탭, {total_count}개 예약됨"
             if repeating_count > 0:
-                status_msg += f" (일회성: {one_time_count}개, 반복: {repeating_count}개)"
-            self.status_bar.showMessage(status_msg, 3000)
+                status_msg += f" (일회성: {total_count - repeating_count}개, 반복: {repeating_count}개)"
+        self._schedule_summary = (version, status_msg)
+        return status_msg
     
+    @Slot()
+    def _tick_label(self):
+        """다음 새로고침까지 남은 시간 표시"""
+        if self.auto_refresh_enabled and self.refresh_timer.isActive():
+            remaining = max(0, self.refresh_timer.remainingTime()) // 1000
+            self.next_refresh_label.setText(f"다음 새로고침: {remaining}초 후")
+        else:
+            self.next_refresh_label.setText("다음 새로고침: 비활성")
+    
+    @Slot()
+    def _update_label_timer(self):
+        """남은 시간을 볼 수 있을 때만 표시 타이머 실행"""
+        visible = (self.isVisible() and not self.isMinimized()
+                   and self.tab_widget.currentIndex() == 0)
+        if self.auto_refresh_enabled and visible:
+            if not self._label_timer.isActive():
+                self._tick_label()
+                self._label_timer.start()
+        elif self._label_timer.isActive():
+            self._label_timer.stop()
+    
+    def showEvent(self, event):
+        """창이 표시되면 남은 시간 표시 재개"""
+        super().showEvent(event)
+        self._update_label_timer()
+    
+    def hideEvent(self, event):
+        """창이 숨겨지면 남은 시간 표시 중지"""
+        super().hideEvent(event)
+        self._update_label_timer()
+    
+    @Slot(int)
     def show_progress(self, value):
         """진행 표시줄 표시"""
-        self.progress_bar.show()
         self.progress_bar.setValue(value)
-        QApplication.processEvents()
+        self.progress_bar.show()
     
     def hide_progress(self):
         """진행 표시줄 숨김"""
         self.progress_bar.hide()
-        QApplication.processEvents()
     
-    def set_gui_enabled(self, enabled):
-        """GUI 활성화/비활성화"""
-        self.setEnabled(enabled)
-        QApplication.processEvents()
+    def set_refresh_buttons_enabled(self, enabled):
+        """새로고침 버튼만 활성화/비활성화 (진행 중에도 나머지 GUI는 사용 가능)"""
+        self.refresh_selected_btn.setEnabled(enabled)
+        self.refresh_all_btn.setEnabled(enabled)
     
     def show_error(self, message):
-        """오류 메시지 표시"""
+        """복구할 수 없는 오류 메시지를 대화상자로 표시"""
         self.status_bar.showMessage(f"오류: {message}")
         QMessageBox.critical(self, "오류", message)
-        print(f"오류: {message}")
-        traceback.print_exc()
+        # 처리 중인 예외가 있을 때만 스택 트레이스를 함께 기록
+        logger.error(f"오류: {message}", exc_info=sys.exc_info()[0] is not None)
+    
+    def report_error(self, message):
+        """복구 가능한 오류는 대화상자 없이 상태바와 로그에만 표시"""
+        self.status_bar.showMessage(f"오류: {message}", 5000)
+        # 처리 중인 예외가 있을 때만 스택 트레이스를 함께 기록
+        logger.error(f"오류: {message}", exc_info=sys.exc_info()[0] is not None)
     
     def closeEvent(self, event):
         """프로그램 종료 시 처리"""
@@ -764,24 +1266,29 @@ class MainWindow(QMainWindow):
                 self.refresh_timer.stop()
             if self.time_check_timer.isActive():
                 self.time_check_timer.stop()
-        except:
+            if self._label_timer.isActive():
+                self._label_timer.stop()
+        except RuntimeError:
+            # 종료 중 이미 삭제된 Qt 객체 접근 시 발생 - 무시
             pass
         event.accept()
     
+    @Slot()
     def remove_selected_tab(self):
         """선택한 탭 제거"""
         if not hasattr(self, 'managed_tabs_list') or self.managed_tabs_list is None:
             self.status_bar.showMessage("탭 목록이 초기화되지 않았습니다")
             return
             
-        selected_items = self.managed_tabs_list.selectedItems()
-        if not selected_items:
+        if not self._has_managed_selection():
             self.status_bar.showMessage("제거할 탭을 선택하세요")
             return
+        selected_items = self.managed_tabs_list.selectedItems()
         
         removed_any = False
         for item in selected_items:
-            tab_id = item.data(Qt.UserRole)
+            tab = self._tab_for_item(item)
+            tab_id = tab.id
             tab_name = item.text()
             
             confirm = QMessageBox.question(
@@ -792,37 +1299,36 @@ class MainWindow(QMainWindow):
             
             if confirm == QMessageBox.Yes:
                 if self.tab_manager.remove_tab(tab_id):
+                    self._tab_refreshed_at.pop(self._refresh_key(tab_id, tab.browser_type), None)
                     self.status_bar.showMessage(f"탭 '{tab_name}' 제거됨")
                     removed_any = True
         
         if removed_any:
             self.update_managed_tabs_list()
-            self.update_status_labels()
+            self._request_status_update()
             # 탭이 제거되었으므로 시간 체크 타이머 상태 업데이트
-            self.update_time_check_timer()
+            self._schedule_next_check()
     
     def get_current_browser_type(self):
         """현재 선택된 브라우저 타입 반환"""
-        if self.chrome_radio.isChecked():
-            return "chrome"
-        elif self.firefox_radio.isChecked():
-            return "firefox"
-        elif self.edge_radio.isChecked():
-            return "edge"
-        elif self.safari_radio.isChecked():
-            return "safari"
-        else:
-            return "chrome"  # 기본값 
+        return self._current_browser_type
 
     def get_selected_tab_ids(self):
         """선택된 탭의 ID 목록 반환"""
+        if not self._has_managed_selection():
+            return []
         selected_items = self.managed_tabs_list.selectedItems()
-        return [item.data(Qt.UserRole) for item in selected_items]
+        return [self._tab_for_item(item).id for item in selected_items]
+    
+    def _has_managed_selection(self):
+        """관리 탭 목록에 선택된 항목이 있는지 (선택 항목 목록을 만들지 않고 확인)"""
+        return self.managed_tabs_list.selectionModel().hasSelection()
 
     def update_table_view(self):
         """관리 중인 탭 목록 업데이트"""
         self.update_managed_tabs_list()
 
+    @Slot()
     def managed_tabs_selection_changed(self):
         """탭 목록에서 선택된 항목이 변경되면 호출됨"""
-        self.update_status_labels() 
\ No newline at end of file
+        self._request_status_update() 
\ No newline at end of file
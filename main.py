@@ -5,14 +5,14 @@ Chrome과 Edge 브라우저 탭을 모니터링하고 자동으로 새로고침
 """
 import sys
 import os
-import json
 import argparse
+import functools
 import logging
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer, QStandardPaths
 
 from gui import MainWindow
-from tab_manager import TabManager
+from tab_manager import TabManager, loads_json
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, 
@@ -21,11 +21,11 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger('BrowserTabManager')
 
 # 설정 파일 경로
+@functools.lru_cache(maxsize=1)
 def get_config_path():
-    """설정 파일 경로 반환"""
+    """설정 파일 경로 반환 (경로 조회와 디렉터리 생성은 최초 1회만 수행)"""
     app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-    if not os.path.exists(app_data):
-        os.makedirs(app_data, exist_ok=True)
+    os.makedirs(app_data, exist_ok=True)
     config_path = os.path.join(app_data, 'tab_handles.json')
     return config_path
 
@@ -33,8 +33,8 @@ def load_tab_handles(config_path):
     """설정 파일에서 탭 정보 로드"""
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return loads_json(f.read())
         except:
             logger.warning(f"설정 파일을 로드할 수 없습니다: {config_path}")
     
@@ -44,14 +44,6 @@ def load_tab_handles(config_path):
         "managed_tabs": []
     }
 
-def save_tab_handles(config_path, tab_handles):
-    """설정 파일에 탭 정보 저장"""
-    try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(tab_handles, f, ensure_ascii=False, indent=2)
-    except:
-        logger.warning(f"설정 파일을 저장할 수 없습니다: {config_path}")
-
 def parse_arguments():
     """명령줄 인수 파싱"""
     parser = argparse.ArgumentParser(description='Browser Tab Refresh - 브라우저 탭 모니터링 및 자동 새로고침')
@@ -65,6 +57,8 @@ def parse_arguments():
                         help='시작 시 저장된 모든 탭 즉시 리프레시')
     parser.add_argument('--auto', action='store_true', 
                         help='시작 시 자동 리프레시 활성화')
+    parser.add_argument('--pretty-config', action='store_true',
+                        help='설정 파일을 들여쓰기하여 읽기 쉽게 저장')
     return parser.parse_args()
 
 def main():
@@ -93,7 +87,9 @@ def main():
     app.setApplicationName("Browser Tab Manager")
     
     # 탭 매니저 생성
-    tab_manager = TabManager(tab_handles)
+    # (설정 파일에 직접 저장하므로 저장 경로도 함께 전달)
+    tab_manager = TabManager(tab_handles, tab_info_file=config_path,
+                             pretty_config=args.pretty_config)
     
     # 메인 윈도우 생성
     main_window = MainWindow(tab_manager)
@@ -109,13 +105,13 @@ def main():
         main_window.auto_refresh_check.setChecked(True)
         main_window.toggle_auto_refresh(True)
     
-    # 30초마다 탭 설정 저장
+    # 30초마다 탭 설정 저장 (변경 사항이 있을 때만 실제로 파일에 씀)
     save_timer = QTimer()
-    save_timer.timeout.connect(lambda: save_tab_handles(config_path, tab_manager.get_tab_handles()))
+    save_timer.timeout.connect(tab_manager.save_tabs)
     save_timer.start(30000)  # 30초
     
     # 애플리케이션 종료 시 설정 저장
-    app.aboutToQuit.connect(lambda: save_tab_handles(config_path, tab_manager.get_tab_handles()))
+    app.aboutToQuit.connect(tab_manager.save_tabs)
     
     # 애플리케이션 실행
     main_window.show()
@@ -8,15 +8,19 @@ import json
 import time
 import logging
 import platform
-import pyautogui
 import subprocess
-import random
 import re
+import socket
+import http.client
 from datetime import datetime, timedelta  # datetime과 timedelta 클래스를 직접 import
 import threading
 import sys
 import concurrent.futures  # 추가: 병렬 처리를 위한 concurrent.futures 모듈
-import tempfile
+import bisect
+import functools
+import itertools
+import hashlib
+from collections import namedtuple
 
 # 로깅 설정
 logger = logging.getLogger('TabManager')
@@ -35,40 +39,343 @@ if not logger.handlers:
 # OS 확인
 SYSTEM = platform.system()
 
-# Windows에서만 pygetwindow 임포트
+# 한 번 파싱한 예약 시간 (매일 반복 여부, 자정 기준 초, 초 단위 지정 여부, 표시용 'HH:MM[:SS]', 저장된 원래 문자열)
+# 필드 순서대로 비교하면 일회성 먼저, 각각 시각순으로 정렬됨
+ScheduledTime = namedtuple("ScheduledTime", "repeating sec_of_day has_seconds clock text")
+
+# 관리 탭 정보 (탭마다 dict를 두지 않고 고정 필드 튜플로 보관, 브라우저 타입이 없던 옛 설정은 None)
+ManagedTab = namedtuple("ManagedTab", "id name browser_type", defaults=(None,))
+
+def managed_tabs_from_json(tabs):
+    """설정 파일의 탭 dict 목록을 ManagedTab 목록으로 변환 (알 수 없는 키는 무시)"""
+    return [ManagedTab(tab.get("id"), tab.get("name"), tab.get("browser_type")) for tab in tabs]
+
+def managed_tabs_to_json(tabs):
+    """ManagedTab 목록을 설정 파일용 dict 목록으로 변환 (값이 없는 브라우저 타입은 생략)"""
+    return [{k: v for k, v in tab._asdict().items() if v is not None} for tab in tabs]
+
+# Windows에서만 user32/win32gui 로드 (pygetwindow/pyautogui는 실제로 필요할 때 임포트)
+# win32gui는 창 목록을 가져올 때마다 쓰므로 모듈 로드 시 한 번만 임포트 (pywin32가 없으면 None)
+win32gui = None
 if SYSTEM == "Windows":
-    import pygetwindow as gw
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    # 64비트 창 핸들이 잘리지 않도록 인자/반환 타입 지정
+    user32.FindWindowExW.argtypes = (wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR)
+    user32.FindWindowExW.restype = wintypes.HWND
+    user32.PostMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+    user32.PostMessageW.restype = wintypes.BOOL
+    try:
+        import win32gui
+    except ImportError:
+        pass
+
+# 창 핸들에 직접 보내는 F5 키 메시지 (포커스를 옮기지 않고 새로고침)
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+VK_F5 = 0x74
+F5_KEYDOWN_LPARAM = 0x003F0001  # 반복 횟수 1, 스캔 코드 0x3F
+F5_KEYUP_LPARAM = 0xC03F0001  # 이전 키 상태/전이 비트 설정
+
+# Chromium 계열(Chrome/Edge)에서 키 입력을 실제로 처리하는 페이지 렌더링 자식 창 클래스
+# (최상위 프레임 창은 게시된 WM_KEYDOWN F5를 무시하는 경우가 많음)
+CHROMIUM_RENDER_WIDGET_CLASS = "Chrome_RenderWidgetHostHWND"
+
+# 새로고침 키 메시지를 창에 보내기만 한 경우의 결과 (참으로 평가되지만 실제 새로고침 여부는 확인할 수 없음)
+REFRESH_SENT = "sent"
+
+# 브라우저 타입별 창 제목 식별 패턴 (제목마다 문자열 검색을 반복하지 않도록 미리 컴파일)
+BROWSER_TITLE_PATTERNS = {
+    "chrome": re.compile(r"Chrome"),
+    "firefox": re.compile(r"Firefox|Mozilla"),
+    "edge": re.compile(r"Edge"),
+    "safari": re.compile(r"Safari"),
+}
+
+# "페이지 제목 - 브라우저 이름"에서 페이지 제목 부분을 한 번에 추출
+# (브라우저 이름은 끝에 고정하여 "Foo - Edge cases - Google Chrome"처럼 제목 안의 브라우저 이름은 유지)
+TAB_NAME_RE = re.compile(r"^(.*) - (?:Google Chrome|Chrome|Microsoft Edge|Edge|Safari)$")
+
+@functools.lru_cache(maxsize=1024)
+def extract_tab_name(title):
+    """창 제목에서 탭 이름 추출 (같은 제목이 스캔마다 반복되므로 결과를 캐시)"""
+    # 브라우저 이름 부분 제거 (미리 컴파일한 패턴으로 한 번에 분리)
+    match = TAB_NAME_RE.match(title)
+    if match:
+        return match.group(1).strip()
+    # 대부분의 브라우저는 "페이지 제목 - 브라우저 이름" 형식 사용
+    return title.split(" - ", 1)[0].strip()
+
+# macOS 창 목록 AppleScript 출력의 한 줄 "ID|제목[|URL]" (앞뒤 공백 제외)
+MACOS_WINDOW_LINE_RE = re.compile(r"^[ \t]*(\d+)[ \t]*\|[ \t]*([^|\n]*?)[ \t]*(?:\|[ \t]*([^\n]*?)[ \t]*)?$", re.M)
+
+# Chrome/Edge 원격 디버깅 포트와 열림 여부를 재사용하는 시간 (초)
+DEBUG_PORT = 9222
+DEBUG_PORT_CACHE_TTL = 30.0
+
+# macOS 브라우저 타입별 애플리케이션 이름
+MACOS_BROWSER_NAMES = {
+    "chrome": "Google Chrome",
+    "firefox": "Firefox",
+    "edge": "Microsoft Edge",
+}
+
+# macOS AppleScript - 창 ID와 프로세스 이름은 실행 인자(argv)로 넘기므로
+# 스크립트 문자열은 모듈 로드 시 브라우저별로 한 번만 만듦
+MACOS_PROCESS_RUNNING_SCRIPT = '''
+on run argv
+    tell application "System Events"
+        return exists process (item 1 of argv)
+    end tell
+end run
+'''
+
+# 탭 하나 새로고침 (인덱스 기반 정밀 접근, 실패 시 키보드 명령)
+_MACOS_REFRESH_TEMPLATE = '''
+on run argv
+    set wid to (item 1 of argv) as integer
+    tell application "{browser_name}"
+        set windowCount to count of windows
+        if windowCount is 0 then
+            return "Error: No windows open"
+        end if
+        
+        set found to false
+        set window_index to 0
+        
+        # 먼저 ID로 창 찾기 시도
+        repeat with i from 1 to windowCount
+            if id of window i is wid then
+                set window_index to i
+                set found to true
+                exit repeat
+            end if
+        end repeat
+        
+        # ID로 찾지 못한 경우 창 ID가 숫자 체계를 따르는지 확인
+        if not found then
+            # 창 ID가 2001, 3001 등의 패턴인 경우 해당 인덱스 사용
+            if wid > 1000 then
+                set possible_index to wid div 1000
+                if possible_index <= windowCount then
+                    set window_index to possible_index
+                    set found to true
+                end if
+            end if
+        end if
+        
+        # 그래도 찾지 못한 경우 첫 번째 창 사용
+        if not found then
+            set window_index to 1
+        end if
+        
+        # 탭 새로고침 수행
+        set tab_index to 1
+        if wid mod 1000 > 0 then
+            set tab_index to wid mod 1000
+        end if
+        
+        try
+            set total_tabs to count of tabs of window window_index
+            if tab_index > total_tabs then
+                set tab_index to 1
+            end if
+            
+            tell window window_index
+                # 새로고침할 탭 활성화 후 새로고침
+                set active tab index to tab_index
+                tell active tab to reload
+            end tell
+            
+            return "Success: Tab refreshed. 창 " & windowCount & "개 발견. 창 인덱스 " & window_index & ", 탭 인덱스 " & tab_index & " 접근 시도."
+        on error errMsg
+            # 오류 발생 시 단순 명령으로 시도
+            activate
+            tell application "System Events"
+                tell process "{browser_name}"
+                    keystroke "r" using {{command down}}
+                end tell
+            end tell
+            return "Success: Fallback refresh using keyboard command. Error: " & errMsg
+        end try
+    end tell
+end run
+'''
+
+# 같은 브라우저의 여러 탭을 한 번에 새로고침 (argv의 각 창 ID마다 "OK:id" 또는 "FAIL:id")
+_MACOS_REFRESH_MANY_TEMPLATE = '''
+on run argv
+    tell application "{browser_name}"
+        set windowCount to count of windows
+        set results to {{}}
+        repeat with wid_ref in argv
+            set wid to (contents of wid_ref) as integer
+            set window_index to 0
+            
+            # 먼저 ID로 창 찾기 시도
+            repeat with i from 1 to windowCount
+                if id of window i is wid then
+                    set window_index to i
+                    exit repeat
+                end if
+            end repeat
+            
+            # 창 ID가 2001, 3001 등의 패턴인 경우 해당 인덱스 사용, 그래도 없으면 첫 번째 창
+            if window_index is 0 and wid > 1000 then
+                if (wid div 1000) <= windowCount then set window_index to wid div 1000
+            end if
+            if window_index is 0 and windowCount > 0 then set window_index to 1
+            
+            try
+                set tab_index to 1
+                if wid mod 1000 > 0 then set tab_index to wid mod 1000
+                if tab_index > (count of tabs of window window_index) then set tab_index to 1
+                tell window window_index
+                    set active tab index to tab_index
+                    tell active tab to reload
+                end tell
+                set end of results to "OK:" & wid
+            on error
+                set end of results to "FAIL:" & wid
+            end try
+        end repeat
+        set AppleScript's text item delimiters to ","
+        return results as text
+    end tell
+end run
+'''
+
+MACOS_REFRESH_SCRIPTS = {
+    browser_type: _MACOS_REFRESH_TEMPLATE.format(browser_name=browser_name)
+    for browser_type, browser_name in MACOS_BROWSER_NAMES.items()
+}
+MACOS_REFRESH_MANY_SCRIPTS = {
+    browser_type: _MACOS_REFRESH_MANY_TEMPLATE.format(browser_name=MACOS_BROWSER_NAMES[browser_type])
+    for browser_type in ("chrome", "edge")
+}
+
+# Safari 탭 목록 - 제목/URL을 함께 가져오고, 실패한 탭은 스크립트 안에서 간단한 형식으로 대체
+# (간단한 방법과 상세한 방법을 osascript 한 번으로 처리)
+MACOS_SAFARI_WINDOWS_SCRIPT = '''
+tell application "System Events"
+    set safariRunning to exists process "Safari"
+end tell
+
+if safariRunning then
+    tell application "Safari"
+        set windowInfo to ""
+        set windowCount to count windows
+        
+        repeat with w from 1 to windowCount
+            set currentWindow to window w
+            try
+                set tabCount to count tabs of currentWindow
+                repeat with t from 1 to tabCount
+                    set currentTab to tab t of currentWindow
+                    set uniqueId to ((w * 1000) + t) as string
+                    try
+                        set tabTitle to name of currentTab
+                    on error
+                        set tabTitle to "Safari Tab " & t
+                    end try
+                    try
+                        set windowInfo to windowInfo & uniqueId & "|" & tabTitle & "|" & (URL of currentTab) & "\\n"
+                    on error
+                        set windowInfo to windowInfo & uniqueId & "|" & tabTitle & "|Safari\\n"
+                    end try
+                end repeat
+            end try
+        end repeat
+        
+        return windowInfo
+    end tell
+else
+    return "Safari is not running"
+end if
+'''
+
+# orjson이 설치되어 있으면 설정 파일 읽기/쓰기에 사용 (선택 사항, 없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_json(data, pretty=False):
+    """설정 데이터를 UTF-8 바이트로 직렬화 (pretty=True면 들여쓰기)"""
+    if orjson is not None:
+        # 표준 json처럼 문자열이 아닌 키(예: 정수 창 ID)도 문자열로 변환
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    # 공백 없는 압축 형식 (들여쓰기는 C 인코더를 쓰지 못하고 크기도 커짐)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads_json(data):
+    """UTF-8 바이트(또는 문자열)에서 설정 데이터 복원"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class TabManager:
-    def __init__(self, tab_handles=None):
+    def __init__(self, tab_handles=None, tab_info_file=None, pretty_config=False):
         """
         TabManager 초기화
         
         Args:
             tab_handles (dict): 관리할 탭 정보가 포함된 딕셔너리
+            tab_info_file (str): 탭 정보를 저장할 파일 경로 (기본값: 현재 디렉토리의 tab_handles.json)
+            pretty_config (bool): 저장 파일을 사람이 읽기 쉽게 들여쓰기할지 여부 (기본값: 압축 형식)
         """
-        self.tab_info_file = "tab_handles.json"
+        self.tab_info_file = tab_info_file or "tab_handles.json"
+        self.pretty_config = pretty_config
         self.browser_type = "chrome"  # 기본값
         self.managed_tabs = []
         self.system = SYSTEM  # 운영체제 확인
-        self.scheduled_refreshes = {}  # 예약된 새로고침 시간 저장
+        self.scheduled_refreshes = {}  # 예약된 새로고침 시간 (읽기 전용 스냅샷, _mark_changed에서 새 dict로 교체)
         self.tab_lock = threading.Lock()  # 스레드 안전을 위한 락
-        self._tab_scheduled_refreshes = {}  # 내부적으로 사용할 예약된 새로고침 시간
+        self._tab_scheduled_refreshes = {}  # 예약 시간 작업용 사본 (tab_lock 안에서만 수정)
+        self._save_lock = threading.Lock()  # 동시에 두 번 저장할 때 임시 파일/교체 경쟁 방지
+        self.schedule_version = 0  # 탭/예약 정보가 바뀔 때마다 증가 (표시 문자열 캐시 무효화용)
+        self._dirty = False  # 마지막 저장 이후 변경 사항이 있는지 (save_tabs에서만 초기화)
+        self._last_written_digest = None  # 마지막으로 파일에 쓴(또는 읽은) 내용의 해시
+        self._hwnd_cache = {}  # Windows 창 핸들 -> pygetwindow 창 (_get_hwnd_map에서 갱신)
+        self._hwnd_cache_ts = 0.0  # 창 핸들 캐시를 만든 시각 (time.monotonic)
+        self._hwnd_cache_lock = threading.Lock()  # 병렬 새로고침 작업자 간 캐시 갱신 보호
+        self._debug_port_cache = (float("-inf"), False)  # (확인 시각 time.monotonic, 디버깅 포트 열림 여부)
+        self._debug_conns = {}  # 디버깅 포트 -> 재사용하는 HTTP 연결 (keep-alive)
+        self._schedule_index_cache = (None, ({}, {}, [], {}))  # (schedule_version, 파싱된 예약 색인)
+        self._last_schedule_check_sec = None  # 마지막으로 예약을 확인한 시각 (epoch 초)
+        self._last_schedule_check_minute = None  # HH:MM 예약을 마지막으로 실행한 분 (epoch 분)
+        self._tabs_by_id = {}  # str(탭 ID) -> 탭 정보 (managed_tabs가 바뀔 때 함께 갱신)
+        self._tab_keys = set()  # 중복 검사용 (탭 ID, 브라우저 타입) 집합
         
         # 설정에서 관리 탭 초기화
         if tab_handles is None:
             self.load_tabs()
         else:
             self.browser_type = tab_handles.get("browser_type", "chrome")
-            self.managed_tabs = tab_handles.get("managed_tabs", [])
+            self.managed_tabs = managed_tabs_from_json(tab_handles.get("managed_tabs", []))
             self.scheduled_refreshes = tab_handles.get("scheduled_refreshes", {})
-            self._tab_scheduled_refreshes = self.scheduled_refreshes.copy()  # 내부 변수 초기화
+            self._tab_scheduled_refreshes = self._copy_schedules(self.scheduled_refreshes)  # 내부 변수 초기화
+            self._rebuild_tab_index()
+    
+    def _rebuild_tab_index(self):
+        """managed_tabs로부터 ID 색인과 중복 검사용 키 집합을 다시 만듦"""
+        self._tabs_by_id = {}
+        for tab in self.managed_tabs:
+            # 같은 ID가 여러 브라우저에 있으면 목록에서 먼저 나온 탭을 사용 (기존 순차 검색과 동일)
+            self._tabs_by_id.setdefault(str(tab.id), tab)
+        self._tab_keys = {(tab.id, tab.browser_type) for tab in self.managed_tabs}
     
     def get_tab_handles(self):
         """현재 탭 설정 반환"""
         return {
             "browser_type": self.browser_type,
-            "managed_tabs": self.managed_tabs,
+            "managed_tabs": managed_tabs_to_json(self.managed_tabs),
             "scheduled_refreshes": self.scheduled_refreshes
         }
     
@@ -76,12 +383,15 @@ class TabManager:
         """탭 정보 로드"""
         try:
             if os.path.exists(self.tab_info_file):
-                with open(self.tab_info_file, 'r', encoding='utf-8') as f:
-                    tab_data = json.load(f)
+                with open(self.tab_info_file, 'rb') as f:
+                    raw = f.read()
+                    tab_data = loads_json(raw)
+                    self._last_written_digest = self._config_digest(raw)
                     self.browser_type = tab_data.get("browser_type", "chrome")
-                    self.managed_tabs = tab_data.get("managed_tabs", [])
+                    self.managed_tabs = managed_tabs_from_json(tab_data.get("managed_tabs", []))
                     self.scheduled_refreshes = tab_data.get("scheduled_refreshes", {})
-                    self._tab_scheduled_refreshes = self.scheduled_refreshes.copy()  # 내부 변수 초기화
+                    self._tab_scheduled_refreshes = self._copy_schedules(self.scheduled_refreshes)  # 내부 변수 초기화
+                    self._rebuild_tab_index()
                     
                     # 시작 시 과거 시간 정리
                     self._clean_past_scheduled_times()
@@ -94,105 +404,143 @@ class TabManager:
             self.managed_tabs = []
             self.scheduled_refreshes = {}
             self._tab_scheduled_refreshes = {}
+            self._rebuild_tab_index()
     
     def _clean_past_scheduled_times(self):
         """현재 시간보다 이전 시간을 모두 정리합니다."""
+        # 예약이 하나도 없으면 (첫 실행 등) 시간 계산과 순회를 모두 생략
+        if not self._tab_scheduled_refreshes:
+            return
+        
         try:
-            # 현재 시간 가져오기
-            current_time = datetime.now()
-            current_hour = current_time.hour
-            current_minute = current_time.minute
+            # 현재 시간 가져오기 (자정 기준 분만 필요하므로 datetime 대신 struct_time 사용)
+            current_time = time.localtime()
+            # 자정 기준 분으로 한 번만 계산하여 정수 하나로 비교
+            cutoff = current_time.tm_hour * 60 + current_time.tm_min
             
-            cleaned_tabs = 0
-            cleaned_times = 0
+            def keep(time_str):
+                try:
+                    # HH:MM 또는 HH:MM:SS 형식 - 분할 없이 고정 위치를 바로 정수로 변환
+                    if len(time_str) in (5, 8) and time_str[2] == ":":
+                        # 미래 시간만 유효하게 처리
+                        return int(time_str[0:2]) * 60 + int(time_str[3:5]) > cutoff
+                    # 매일 반복 시간은 지난 시간이 없으므로 그대로 유지
+                    return time_str.startswith("*")
+                except (ValueError, TypeError, AttributeError):
+                    # 잘못된 형식은 무시
+                    return False
             
-            # 모든 탭의 예약 시간 확인
-            for tab_id_str, times in list(self.scheduled_refreshes.items()):
-                if not times or not isinstance(times, list):
-                    continue
-                
-                valid_times = []
-                for time_str in times:
-                    try:
-                        # 시간 형식 분석
-                        if len(time_str) == 5:  # HH:MM 형식
-                            scheduled_h, scheduled_m = map(int, time_str.split(":"))
-                            # 미래 시간만 유효하게 처리
-                            if (scheduled_h > current_hour) or (scheduled_h == current_hour and scheduled_m > current_minute):
-                                valid_times.append(time_str)
-                            else:
-                                cleaned_times += 1
-                        elif len(time_str) == 8:  # HH:MM:SS 형식
-                            scheduled_h, scheduled_m, _ = map(int, time_str.split(":"))
-                            # 미래 시간만 유효하게 처리
-                            if (scheduled_h > current_hour) or (scheduled_h == current_hour and scheduled_m > current_minute):
-                                valid_times.append(time_str)
-                            else:
-                                cleaned_times += 1
-                    except (ValueError, TypeError):
-                        # 잘못된 형식은 무시
-                        continue
-                
-                # 유효한 시간만 저장하거나 빈 목록이면 해당 탭 제거
-                if valid_times:
-                    self.scheduled_refreshes[tab_id_str] = valid_times
-                else:
-                    self.scheduled_refreshes.pop(tab_id_str)
-                    cleaned_tabs += 1
+            # 모든 탭의 예약 시간을 한 번에 걸러 새 dict로 만듦 (목록 복사/pop 없이)
+            # 빈 목록이 되었거나 목록이 아닌 항목의 탭은 제외
+            schedules = self._tab_scheduled_refreshes
+            cleaned = {
+                tab_id_str: kept
+                for tab_id_str, kept in (
+                    (tab_id_str, [t for t in times if keep(t)] if isinstance(times, list) else [])
+                    for tab_id_str, times in schedules.items()
+                )
+                if kept
+            }
+            
+            cleaned_tabs = len(schedules) - len(cleaned)
+            cleaned_times = (sum(len(times) for times in schedules.values() if isinstance(times, list))
+                             - sum(map(len, cleaned.values())))
             
             if cleaned_times > 0 or cleaned_tabs > 0:
+                self._tab_scheduled_refreshes = cleaned
                 logger.info(f"시작 시 정리: {cleaned_times}개의 과거 시간 제거, {cleaned_tabs}개의 빈 탭 제거")
-                self.save_tabs()
-            
-            # 내부 변수 동기화
-            self._tab_scheduled_refreshes = self.scheduled_refreshes.copy()
+                self._mark_changed()
                 
         except Exception as e:
             logger.error(f"과거 시간 정리 중 오류: {e}", exc_info=True)
     
+    def _mark_changed(self):
+        """
+        탭/예약 정보 변경 기록
+        내부 예약 정보를 동기화하고 버전을 올린 뒤 저장이 필요하다고 표시
+        (파일 쓰기는 save_tabs가 주기적으로/종료 시 한 번에 수행)
+        """
+        # 작업용 사본에서 새 스냅샷을 만든 뒤 속성 대입 한 번으로 교체
+        # (대입은 원자적이므로 읽는 쪽은 락 없이 참조를 한 번 잡아 두고 사용하면 됨)
+        # 시간 목록은 제자리에서 수정하지 않고 항상 새 목록으로 교체하므로 목록마다 복사하지 않고 공유
+        self.scheduled_refreshes = {
+            window_id: times
+            for window_id, times in self._tab_scheduled_refreshes.items()
+            if isinstance(times, list) and times  # 비어있지 않은 유효한 목록만 저장
+        }
+        
+        # 모든 변경은 여기를 거치므로 여기서 버전 증가
+        self.schedule_version += 1
+        self._dirty = True
+    
+    @staticmethod
+    def _copy_schedules(schedules):
+        """예약 정보 사본 (시간 목록까지 복사하여 스냅샷과 작업용 사본이 목록을 공유하지 않도록 함)"""
+        return {window_id: list(times) if isinstance(times, list) else times
+                for window_id, times in schedules.items()}
+    
+    @staticmethod
+    def _config_digest(data_bytes):
+        """설정 파일 내용 비교용 해시"""
+        return hashlib.blake2b(data_bytes, digest_size=16).digest()
+    
+    @staticmethod
+    def _fsync_dir(path):
+        """디렉터리 fsync (POSIX만 지원, Windows에서는 디렉터리를 열 수 없어 생략)"""
+        if SYSTEM == "Windows":
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
     def save_tabs(self):
-        """탭 정보 저장"""
+        """탭 정보 저장 - 마지막 저장 이후 변경된 경우에만 파일에 씀"""
+        if not self._dirty:
+            return True
         try:
-            # 재귀적 호출과 데드락 방지를 위해 락 사용 패턴 개선
-            # 락 획득 시도
-            lock_acquired = self.tab_lock.acquire(timeout=2.0)
-            if not lock_acquired:
-                logger.warning("탭 정보 저장 시 락 획득 실패, 락 없이 진행합니다.")
+            # 탭 락 없이 현재 스냅샷 참조만 잡아서 직렬화 (쓰는 쪽은 항상 새 객체로 교체)
+            # 스냅샷 이후의 변경은 다시 _dirty를 세워 다음 저장에 반영되도록 먼저 초기화
+            self._dirty = False
+            tab_data = {
+                "browser_type": self.browser_type,
+                "managed_tabs": managed_tabs_to_json(self.managed_tabs),
+                "scheduled_refreshes": self.scheduled_refreshes
+            }
             
-            try:
-                # 내부 변수 간 동기화 - 간소화
-                if hasattr(self, '_tab_scheduled_refreshes'):
-                    # 변수 간 동기화를 단방향으로 수행 (단순화)
-                    self.scheduled_refreshes = {}
-                    for window_id, times in self._tab_scheduled_refreshes.items():
-                        if isinstance(times, list) and times:  # 비어있지 않은 유효한 목록만 저장
-                            self.scheduled_refreshes[window_id] = times.copy()
-                
-                # 저장할 데이터 구성
-                tab_data = {
-                    "browser_type": self.browser_type,
-                    "managed_tabs": self.managed_tabs,
-                    "scheduled_refreshes": self.scheduled_refreshes
-                }
-                
+            # 파일 쓰기/교체만 직렬화 (예약 확인/탭 추가와는 경쟁하지 않음)
+            with self._save_lock:
                 # 안전한 파일 저장 (임시 파일 사용)
-                import os
                 temp_file = self.tab_info_file + ".tmp"
                 try:
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        json.dump(tab_data, f, ensure_ascii=False, indent=2)
-                    
-                    # 임시 파일을 실제 파일로 이동 (원자적 연산)
-                    if os.path.exists(temp_file):
-                        if os.path.exists(self.tab_info_file):
-                            os.replace(temp_file, self.tab_info_file)  # 원자적 대체 작업
-                        else:
-                            os.rename(temp_file, self.tab_info_file)
-                        
-                        logger.info(f"{len(self.managed_tabs)}개의 탭 정보를 저장했습니다.")
+                    # 한 번에 바이트로 변환한 뒤 한 번의 쓰기로 기록 (json.dump는 토큰마다 write 호출)
+                    data_bytes = dumps_json(tab_data, pretty=self.pretty_config)
+                    digest = self._config_digest(data_bytes)
+                    if digest == self._last_written_digest:
+                        # 내용이 파일과 같으면 쓰기/fsync 생략
                         return True
+                    with open(temp_file, 'wb', buffering=1 << 16) as f:
+                        f.write(data_bytes)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    
+                    # 임시 파일을 실제 파일로 이동 (원자적 연산, 대상이 없어도 동작)
+                    os.replace(temp_file, self.tab_info_file)
+                    # 이름 변경 자체도 디스크에 남도록 디렉터리 항목을 동기화
+                    self._fsync_dir(os.path.dirname(os.path.abspath(self.tab_info_file)))
+                    
+                    self._last_written_digest = digest
+                    logger.info(f"{len(tab_data['managed_tabs'])}개의 탭 정보를 저장했습니다.")
+                    return True
                 except Exception as e:
                     logger.error(f"파일 저장 중 오류: {e}", exc_info=True)
+                    self._dirty = True  # 다음 저장 때 다시 시도
                     # 임시 파일 정리 시도
                     if os.path.exists(temp_file):
                         try:
@@ -200,10 +548,6 @@ class TabManager:
                         except:
                             pass
                     return False
-            finally:
-                # 락 해제 (획득했을 경우에만)
-                if lock_acquired:
-                    self.tab_lock.release()
             
         except Exception as e:
             logger.error(f"탭 정보 저장 오류: {e}", exc_info=True)
@@ -224,39 +568,28 @@ class TabManager:
         
         try:
             # pywin32로 열린 창 목록 가져오기
-            import win32gui
-            
-            # 브라우저 타입별 제목에 포함될 문자열 지정
-            browser_identifiers = {
-                "chrome": ["Chrome"],
-                "firefox": ["Firefox", "Mozilla"],
-                "edge": ["Edge", "Microsoft Edge"],
-                "safari": ["Safari"]
-            }
+            if win32gui is None:
+                raise ImportError("pywin32(win32gui)가 설치되어 있지 않습니다.")
             
-            current_identifiers = browser_identifiers.get(self.browser_type.lower(), [])
-            if not current_identifiers:
+            # 브라우저 타입별 제목 식별 패턴
+            title_pattern = BROWSER_TITLE_PATTERNS.get(self.browser_type.lower())
+            if title_pattern is None:
                 raise ValueError(f"지원하지 않는 브라우저 타입: {self.browser_type}")
+            # 창마다 속성 조회를 반복하지 않도록 검색 메서드를 미리 바인딩
+            title_search = title_pattern.search
             
             def enum_windows_callback(hwnd, windows):
                 if win32gui.IsWindowVisible(hwnd):
                     try:
                         window_title = win32gui.GetWindowText(hwnd)
-                        if window_title and any(ident in window_title for ident in current_identifiers):
+                        if window_title and title_search(window_title):
                             # 브라우저가 맞으면 목록에 추가
-                            window_info = {
+                            windows.append({
                                 "title": window_title,
                                 "id": hwnd,
                                 "name": self._extract_tab_name(window_title),
                                 "url": window_title  # URL 정보 없음, 제목으로 대체
-                            }
-                            # URL이 있는 경우 (고급 기능)
-                            try:
-                                # 추가 윈도우 관련 정보 가져오기 가능
-                                pass
-                            except:
-                                pass
-                            windows.append(window_info)
+                            })
                     except Exception as e:
                         logger.error(f"창 정보 가져오기 오류: {e}")
             
@@ -265,57 +598,33 @@ class TabManager:
             # Chrome, Edge는 추가적인 탭 정보 처리를 시도
             if self.browser_type.lower() in ["chrome", "edge"]:
                 try:
-                    # Chrome 디버깅 프로토콜 연결 시도
-                    import json
-                    import socket
-                    import os
-                    import subprocess
-                    import psutil
-                    import time
-                    
                     # 기존 창 정보 저장
                     existing_ids = set(win.get("id") for win in browser_windows)
                     
-                    # 탭 정보 가져오기 시도
-                    # Chrome 디버깅 포트 연결 정보 확인
-                    debug_ports = []
-                    
-                    # 브라우저 프로세스 확인
-                    browser_exe = "chrome.exe" if self.browser_type.lower() == "chrome" else "msedge.exe"
-                    
-                    # 열린 브라우저 프로세스 찾기
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            if browser_exe.lower() in proc.info['name'].lower():
-                                # 추가 포트 정보 저장
-                                debug_ports.append(9222)  # 기본 디버깅 포트
-                        except:
-                            pass
+                    # Chrome 디버깅 포트가 열려 있을 때만 연결 시도
+                    # (프로세스 목록을 훑는 대신 포트를 직접 확인하고 결과를 잠시 재사용)
+                    debug_ports = [DEBUG_PORT] if self._is_debug_port_open() else []
                     
                     # 각 디버깅 포트에 연결 시도
                     for port in debug_ports:
                         try:
-                            # HTTP로 탭 정보 요청
-                            import urllib.request
-                            req = urllib.request.Request(f"http://localhost:{port}/json/list")
-                            with urllib.request.urlopen(req, timeout=1.0) as response:
-                                tabs_json = response.read().decode('utf-8')
-                                tabs = json.loads(tabs_json)
-                                
-                                # 각 탭 정보 처리
-                                for idx, tab in enumerate(tabs):
-                                    if 'title' in tab and 'url' in tab:
-                                        # 중복 ID 방지를 위한 고유 ID 생성
-                                        unique_id = 90000 + idx  # 임의의 큰 수에서 시작
-                                        
-                                        # 이미 등록된 창과 중복 확인
-                                        if unique_id not in existing_ids:
-                                            browser_windows.append({
-                                                "title": tab['title'],
-                                                "id": unique_id,
-                                                "name": self._extract_tab_name(tab['title']),
-                                                "url": tab['url']
-                                            })
+                            # HTTP로 탭 정보 요청 (연결 재사용)
+                            tabs = self._fetch_debug_tab_list(port)
+                            
+                            # 각 탭 정보 처리
+                            for idx, tab in enumerate(tabs):
+                                if 'title' in tab and 'url' in tab:
+                                    # 중복 ID 방지를 위한 고유 ID 생성
+                                    unique_id = 90000 + idx  # 임의의 큰 수에서 시작
+                                    
+                                    # 이미 등록된 창과 중복 확인
+                                    if unique_id not in existing_ids:
+                                        browser_windows.append({
+                                            "title": tab['title'],
+                                            "id": unique_id,
+                                            "name": self._extract_tab_name(tab['title']),
+                                            "url": tab['url']
+                                        })
                         except Exception as e:
                             logger.debug(f"탭 정보 가져오기 오류(포트 {port}): {e}")
                 except Exception as e:
@@ -354,16 +663,70 @@ class TabManager:
         
         return browser_windows
     
+    def _is_debug_port_open(self, ttl=DEBUG_PORT_CACHE_TTL):
+        """로컬 디버깅 포트가 열려 있는지 확인 (ttl(초) 동안 이전 확인 결과 재사용)"""
+        checked_at, is_open = self._debug_port_cache
+        now = time.monotonic()
+        if now - checked_at <= ttl:
+            return is_open
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.1)
+            is_open = sock.connect_ex(("127.0.0.1", DEBUG_PORT)) == 0
+        self._debug_port_cache = (now, is_open)
+        return is_open
+    
+    def _fetch_debug_tab_list(self, port):
+        """
+        디버깅 포트의 /json/list 탭 목록 조회
+        포트별 HTTP 연결을 유지하여 스캔할 때마다 TCP 연결을 새로 맺지 않음 (localhost 이름 조회도 생략)
+        """
+        conn = self._debug_conns.get(port)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._debug_conns[port] = http.client.HTTPConnection("127.0.0.1", port, timeout=1.0)
+            try:
+                conn.request("GET", "/json/list")
+                response = conn.getresponse()
+                data = response.read()
+                if response.status != 200:
+                    raise http.client.HTTPException(f"HTTP {response.status}")
+                return loads_json(data)
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                self._debug_conns.pop(port, None)
+                if not reused:
+                    raise
+                # 유지하던 연결이 브라우저 쪽에서 끊긴 경우 새 연결로 한 번만 재시도
+                conn, reused = None, False
+    
+    def _fetch_debug_tab_lists(self, ports):
+        """
+        여러 디버깅 포트의 탭 목록을 병렬로 조회
+        포트마다 최대 1초씩 기다리므로 순차 대신 동시에 요청하여 전체 대기 시간을 가장 느린 포트 하나로 줄임
+        
+        Returns:
+            list: 포트 순서대로 (포트, 탭 목록) 튜플 목록 (조회에 실패한 포트는 제외)
+        """
+        results = {}
+        # 각 요청은 HTTP 연결 타임아웃(1초)으로 제한되므로 별도의 대기 제한은 두지 않음
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(ports), 4))) as executor:
+            future_to_port = {executor.submit(self._fetch_debug_tab_list, port): port for port in ports}
+            for future in concurrent.futures.as_completed(future_to_port):
+                port = future_to_port[future]
+                try:
+                    results[port] = future.result()
+                except Exception as e:
+                    logger.debug(f"디버깅 포트 연결 오류(포트: {port}): {e}")
+        # 결과가 완료 순서에 따라 달라지지 않도록 포트 순서대로 정렬
+        return [(port, results[port]) for port in ports if port in results]
+    
     def _macos_get_browser_windows(self):
         """macOS에서 브라우저 창 목록 가져오기"""
         browser_windows = []
         
         try:
-            import subprocess
-            import json
-            import os
-            import tempfile
-            
             # macOS에서 AppleScript 사용하여 브라우저 창 정보 가져오기
             browser_app_name = {
                 "chrome": "Google Chrome",
@@ -382,63 +745,20 @@ class TabManager:
             except Exception as e:
                 logger.debug(f"프로세스 확인 중 오류: {e}")
             
-            # Safari 브라우저인 경우 먼저 간단한 방법으로 시도
+            # Safari 브라우저는 통합 스크립트 한 번으로 탭 목록을 가져옴
             if self.browser_type.lower() == "safari":
                 logger.info("Safari 탭 가져오기 시도")
-                simple_script = '''
-                tell application "System Events"
-                    set safariRunning to exists process "Safari"
-                end tell
-                
-                if safariRunning then
-                    tell application "Safari"
-                        set windowInfo to ""
-                        set windowCount to count windows
-                        
-                        repeat with w from 1 to windowCount
-                            set currentWindow to window w
-                            try
-                                set tabCount to count tabs of currentWindow
-                                repeat with t from 1 to tabCount
-                                    set currentTab to tab t of currentWindow
-                                    try
-                                        set tabTitle to name of currentTab
-                                        set uniqueId to ((w * 1000) + t)
-                                        set windowInfo to windowInfo & uniqueId & "|" & tabTitle & "|Safari\\n"
-                                    end try
-                                end repeat
-                            end try
-                        end repeat
-                        
-                        return windowInfo
-                    end tell
-                else
-                    return "Safari is not running"
-                end if
-                '''
-                
-                result = self._run_applescript(simple_script)
-                if result and "not running" not in result and result.strip():
-                    lines = result.strip().split('\n')
-                    for line in lines:
-                        if not line.strip():
-                            continue
-                            
-                        parts = line.split('|', 2)
-                        if len(parts) >= 2:
-                            try:
-                                win_id = int(parts[0].strip())
-                                title = parts[1].strip()
-                                
-                                browser_windows.append({
-                                    "id": win_id,
-                                    "title": title + " - Safari",
-                                    "name": title,
-                                    "url": parts[2].strip() if len(parts) > 2 else title,
-                                    "browser_type": "safari"  # 브라우저 타입 명시적 추가
-                                })
-                            except ValueError:
-                                continue
+                result = self._run_applescript(MACOS_SAFARI_WINDOWS_SCRIPT, timeout=10)
+                if result and "not running" not in result:
+                    # 줄 나누기/분할/공백 제거를 정규식 한 번으로 처리
+                    for win_id, title, url in MACOS_WINDOW_LINE_RE.findall(result):
+                        browser_windows.append({
+                            "id": int(win_id),
+                            "title": title + " - Safari",
+                            "name": title,
+                            "url": url or title,
+                            "browser_type": "safari"  # 브라우저 타입 명시적 추가
+                        })
                 
                 # Safari 탭을 찾았으면 바로 반환
                 if browser_windows:
@@ -448,6 +768,7 @@ class TabManager:
             # 방법 1: AppleScript로 브라우저 창/탭 가져오기 - 임시 파일 방식
             try:
                 # 각 브라우저에 맞는 AppleScript 준비
+                # (Safari는 위의 통합 스크립트에서 상세/간단한 방법을 모두 시도했으므로 다시 실행하지 않음)
                 applescript = ""
                 
                 if self.browser_type.lower() == "chrome":
@@ -469,33 +790,6 @@ class TabManager:
                         return windowList
                     end tell
                     '''
-                elif self.browser_type.lower() == "safari":
-                    applescript = f'''
-                    tell application "{browser_app_name}"
-                        set windowList to ""
-                        set windowCount to count windows
-                        repeat with w from 1 to windowCount
-                            set current_window to window w
-                            set tabCount to count tabs of current_window
-                            repeat with t from 1 to tabCount
-                                set current_tab to tab t of current_window
-                                try
-                                    set tabUrl to URL of current_tab
-                                on error
-                                    set tabUrl to "unknown"
-                                end try
-                                try
-                                    set tabTitle to name of current_tab
-                                on error
-                                    set tabTitle to "Safari Tab " & t
-                                end try
-                                set uniqueId to ((w * 1000) + t) as string
-                                set windowList to windowList & uniqueId & "|" & tabTitle & "|" & tabUrl & "\\n"
-                            end repeat
-                        end repeat
-                        return windowList
-                    end tell
-                    '''
                 elif self.browser_type.lower() == "firefox":
                     # Firefox는 각 창의 제목에 현재 활성화된 탭 정보가 포함됨
                     # 여기서는 각 창에서 활성화된 탭을 가져와 별도의 항목으로 처리
@@ -572,52 +866,18 @@ class TabManager:
                     '''
                 
                 if applescript:
-                    # 임시 파일에 스크립트 저장
-                    with tempfile.NamedTemporaryFile(suffix='.scpt', delete=False) as temp:
-                        temp_path = temp.name
-                        temp.write(applescript.encode('utf-8'))
-                    
-                    # AppleScript 실행
-                    cmd = ["osascript", temp_path]
-                    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    stdout, stderr = process.communicate(timeout=10)
-                    
-                    # 임시 파일 삭제
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
-                    
-                    if process.returncode == 0:
-                        result = stdout.decode('utf-8').strip()
-                        
-                        if result:
-                            lines = result.strip().split('\n')
-                            for line in lines:
-                                if not line.strip():
-                                    continue
-                                    
-                                parts = line.split('|', 2)
-                                if len(parts) >= 2:
-                                    win_id = parts[0].strip()
-                                    
-                                    # ID를 정수로 변환 시도
-                                    try:
-                                        win_id = int(win_id)
-                                    except ValueError:
-                                        # 정수로 변환할 수 없으면 해시값 사용
-                                        win_id = hash(win_id) % 10000
-                                    
-                                    title = parts[1].strip()
-                                    url = parts[2].strip() if len(parts) > 2 else title
-                                    
-                                    browser_windows.append({
-                                        "id": win_id,
-                                        "title": title + f" - {self.browser_type.capitalize()}",
-                                        "name": title,
-                                        "url": url,
-                                        "browser_type": self.browser_type  # 브라우저 타입 명시적 추가
-                                    })
+                    result = self._run_applescript(applescript, timeout=10)
+                    if result:
+                        # 줄 나누기/분할/공백 제거를 정규식 한 번으로 처리 (오류 메시지 줄은 일치하지 않음)
+                        title_suffix = f" - {self.browser_type.capitalize()}"
+                        for win_id, title, url in MACOS_WINDOW_LINE_RE.findall(result):
+                            browser_windows.append({
+                                "id": int(win_id),
+                                "title": title + title_suffix,
+                                "name": title,
+                                "url": url or title,
+                                "browser_type": self.browser_type  # 브라우저 타입 명시적 추가
+                            })
             except Exception as e:
                 logger.error(f"AppleScript 실행 중 오류: {e}", exc_info=True)
         
@@ -648,9 +908,6 @@ class TabManager:
         
         try:
             # Linux에서는 xdotool 또는 wnck를 사용하여 창 목록 가져오기
-            import subprocess
-            import json
-            
             # 기본 브라우저 프로세스 이름 매핑
             browser_process = {
                 "chrome": ["chrome", "chromium", "google-chrome", "chromium-browser"],
@@ -710,30 +967,19 @@ class TabManager:
                     # 기존 창 ID들 저장
                     existing_ids = set(win.get("id") for win in browser_windows)
                     
-                    # 디버깅 포트 연결 시도
-                    import urllib.request
-                    import json
-                    
-                    for port in [9222, 9223, 9224]:  # 일반적인 디버깅 포트
-                        try:
-                            req = urllib.request.Request(f"http://localhost:{port}/json/list")
-                            with urllib.request.urlopen(req, timeout=1.0) as response:
-                                tabs_json = response.read().decode('utf-8')
-                                tabs = json.loads(tabs_json)
+                    # 일반적인 디버깅 포트에 동시에 연결 시도 (포트별 연결 재사용)
+                    for port, tabs in self._fetch_debug_tab_lists([9222, 9223, 9224]):
+                        for idx, tab in enumerate(tabs):
+                            if 'title' in tab and 'url' in tab:
+                                unique_id = 90000 + idx  # 임의의 큰 수에서 시작
                                 
-                                for idx, tab in enumerate(tabs):
-                                    if 'title' in tab and 'url' in tab:
-                                        unique_id = 90000 + idx  # 임의의 큰 수에서 시작
-                                        
-                                        if unique_id not in existing_ids:
-                                            browser_windows.append({
-                                                "title": tab['title'],
-                                                "id": unique_id,
-                                                "name": self._extract_tab_name(tab['title']),
-                                                "url": tab['url']
-                                            })
-                        except Exception as e:
-                            logger.debug(f"디버깅 포트 연결 오류(포트: {port}): {e}")
+                                if unique_id not in existing_ids:
+                                    browser_windows.append({
+                                        "title": tab['title'],
+                                        "id": unique_id,
+                                        "name": self._extract_tab_name(tab['title']),
+                                        "url": tab['url']
+                                    })
                 except Exception as e:
                     logger.debug(f"Chrome 디버깅 프로토콜 방식 오류: {e}")
             
@@ -780,52 +1026,28 @@ class TabManager:
         
         return browser_windows
     
-    def _run_applescript(self, script, timeout=5):
-        """AppleScript 실행 (타임아웃 설정 추가)"""
+    def _run_applescript(self, script, timeout=5, args=()):
+        """AppleScript 실행 (타임아웃 설정 추가, args는 스크립트의 on run argv로 전달)"""
         if self.system != "Darwin":  # macOS가 아닌 경우
             return None
             
         try:
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(suffix='.scpt', delete=False) as tf:
-                script_file = tf.name
-                tf.write(script.encode('utf-8'))
+            # 스크립트는 표준 입력으로 전달 ('-'), 긴 스크립트도 명령줄 길이 제한 없이 임시 파일 없이 실행
+            # 출력은 text=True로 한 번에 디코딩
+            process = subprocess.run(['osascript', '-', *map(str, args)],
+                                     input=script, capture_output=True, text=True, encoding='utf-8',
+                                     timeout=timeout, check=False)
             
-            # 명령 실행 (타임아웃 설정)
-            process = subprocess.Popen(['osascript', script_file], 
-                                    stdout=subprocess.PIPE, 
-                                    stderr=subprocess.PIPE)
+            if process.returncode != 0:
+                logger.error(f"AppleScript 오류: {process.stderr}")
+                return process.stderr  # 오류 메시지 반환 (조건부 처리를 위함)
             
-            # 타임아웃과 함께 프로세스 완료 대기
-            try:
-                stdout, stderr = process.communicate(timeout=timeout)
-                
-                # 임시 파일 삭제
-                try:
-                    os.unlink(script_file)
-                except:
-                    pass
-                    
-                if process.returncode != 0:
-                    error_msg = stderr.decode('utf-8')
-                    logger.error(f"AppleScript 오류: {error_msg}")
-                    return error_msg  # 오류 메시지 반환 (조건부 처리를 위함)
-                    
-                return stdout.decode('utf-8').strip()
-                
-            except subprocess.TimeoutExpired:
-                # 타임아웃 발생 시 프로세스 강제 종료
-                process.kill()
-                logger.warning(f"AppleScript 실행 타임아웃 ({timeout}초)")
-                
-                # 임시 파일 삭제 시도
-                try:
-                    os.unlink(script_file)
-                except:
-                    pass
-                    
-                return None
-                
+            return process.stdout.strip()
+            
+        except subprocess.TimeoutExpired:
+            # subprocess.run이 타임아웃 시 프로세스를 강제 종료함
+            logger.warning(f"AppleScript 실행 타임아웃 ({timeout}초)")
+            return None
         except Exception as e:
             logger.error(f"AppleScript 실행 오류: {e}")
             return None
@@ -848,21 +1070,7 @@ class TabManager:
     
     def _extract_tab_name(self, title):
         """창 제목에서 탭 이름 추출"""
-        # 브라우저 이름 부분 제거
-        if " - Chrome" in title:
-            return title.split(" - Chrome")[0].strip()
-        elif " - Google Chrome" in title:
-            return title.split(" - Google Chrome")[0].strip()
-        elif " - Microsoft Edge" in title:
-            return title.split(" - Microsoft Edge")[0].strip()
-        elif " - Edge" in title:
-            return title.split(" - Edge")[0].strip()
-        elif " - Safari" in title:
-            return title.split(" - Safari")[0].strip()
-        elif " - " in title:
-            # 대부분의 브라우저는 "페이지 제목 - 브라우저 이름" 형식 사용
-            return title.split(" - ")[0].strip()
-        return title.strip()
+        return extract_tab_name(title)
     
     def add_tab(self, window_id, tab_title, browser_type="chrome"):
         """특정 브라우저의 탭을 관리 목록에 추가"""
@@ -883,26 +1091,19 @@ class TabManager:
                     logger.info(f"ID 변환 실패, 해시 ID 생성: {converted_id}")
                 
                 # 중복 검사 (정확히 같은 ID의 같은 브라우저 탭만 중복으로 처리)
-                duplicate_found = False
-                for tab in self.managed_tabs:
-                    if tab.get('id') == converted_id and tab.get('browser_type') == browser_type:
-                        logger.warning(f"이미 추가된 탭: ID={converted_id}, 이름={tab_title}, 브라우저={browser_type}")
-                        duplicate_found = True
-                        break
-                
-                if duplicate_found:
+                if (converted_id, browser_type) in self._tab_keys:
+                    logger.warning(f"이미 추가된 탭: ID={converted_id}, 이름={tab_title}, 브라우저={browser_type}")
                     return False
                 
                 # 새 탭 추가 (ID를 정수형으로 저장)
-                tab_info = {
-                    'id': converted_id,
-                    'name': tab_title,
-                    'browser_type': browser_type
-                }
+                tab_info = ManagedTab(converted_id, tab_title, browser_type)
                 
-                self.managed_tabs.append(tab_info)
+                # 목록은 새 객체로 교체 (저장/GUI가 잡아 둔 이전 목록은 그대로 유지)
+                self.managed_tabs = self.managed_tabs + [tab_info]
+                self._tabs_by_id.setdefault(str(converted_id), tab_info)
+                self._tab_keys.add((converted_id, browser_type))
                 logger.info(f"탭 추가 성공: {tab_info}")
-                self.save_tabs()  # 변경사항 저장
+                self._mark_changed()  # 변경사항은 다음 저장 때 기록
                 return True
                 
             except Exception as e:
@@ -911,12 +1112,15 @@ class TabManager:
     
     def remove_tab(self, window_id):
         """관리 탭 제거"""
-        for i, tab in enumerate(self.managed_tabs):
-            if tab["id"] == window_id:
-                self.managed_tabs.pop(i)
-                self.save_tabs()
-                return True
-        return False
+        with self.tab_lock:
+            tab = self._tabs_by_id.get(str(window_id))
+            if tab is None:
+                return False
+            self.managed_tabs = [managed for managed in self.managed_tabs if managed is not tab]
+            # 같은 ID의 다른 브라우저 탭이 남아 있을 수 있으므로 색인은 다시 만듦 (제거는 드묾)
+            self._rebuild_tab_index()
+            self._mark_changed()
+            return True
     
     def refresh_tab(self, window_id, browser_already_running=False):
         """특정 탭 새로고침"""
@@ -924,11 +1128,7 @@ class TabManager:
         logger.info(f"탭 리프레시 시작 - ID: {window_id}")
         
         # 관리 탭에서 해당 window_id를 가진 탭 정보 찾기
-        tab_info = None
-        for tab in self.managed_tabs:
-            if str(tab["id"]) == str(window_id):
-                tab_info = tab
-                break
+        tab_info = self._tabs_by_id.get(str(window_id))
         
         # 탭을 찾지 못한 경우
         if tab_info is None:
@@ -961,8 +1161,8 @@ class TabManager:
             logger.info(f"탭을 찾지 못했지만 ID {window_id}와 브라우저 타입 {browser_type}으로 새로고침 시도")
         else:
             # 탭 정보에 browser_type 필드가 있으면 그 값 사용, 없으면 현재 browser_type 사용
-            browser_type = tab_info.get("browser_type", self.browser_type)
-            logger.info(f"탭 '{tab_info['name']}' (ID: {window_id}, 브라우저: {browser_type}) 새로고침 시도")
+            browser_type = tab_info.browser_type or self.browser_type
+            logger.info(f"탭 '{tab_info.name}' (ID: {window_id}, 브라우저: {browser_type}) 새로고침 시도")
         
         # OS별 처리 로직
         refresh_result = False
@@ -976,32 +1176,82 @@ class TabManager:
             refresh_result = True
             
         # 결과 로깅
-        if refresh_result:
+        if refresh_result == REFRESH_SENT:
+            logger.info(f"탭 ID {window_id} 새로고침 키 전송 (새로고침 여부는 확인 불가)")
+        elif refresh_result:
             logger.info(f"탭 ID {window_id} 새로고침 성공")
         else:
             logger.warning(f"탭 ID {window_id} 새로고침 실패")
             
         return refresh_result
     
+    def _get_hwnd_map(self, ttl=2.0):
+        """
+        Windows 창 핸들 -> 창 객체 맵 반환
+        여러 탭을 연달아 새로고침할 때 창 목록을 탭마다 열거하지 않도록 ttl(초) 동안 재사용
+        """
+        with self._hwnd_cache_lock:
+            if time.monotonic() - self._hwnd_cache_ts > ttl:
+                # 시작 시간을 줄이기 위해 첫 새로고침 때 로드 (이후에는 sys.modules에서 바로 가져옴)
+                import pygetwindow as gw
+                self._hwnd_cache = {window._hWnd: window for window in gw.getAllWindows()}
+                self._hwnd_cache_ts = time.monotonic()
+            return self._hwnd_cache
+    
+    @staticmethod
+    def _find_render_widget(hwnd):
+        """Chromium 최상위 창 아래의 페이지 렌더링 자식 창 핸들 반환 (없으면 None)"""
+        child = user32.FindWindowExW(hwnd, None, CHROMIUM_RENDER_WIDGET_CLASS, None)
+        if child or win32gui is None:
+            return child or None
+        
+        # 바로 아래 자식이 아니면 하위 창 전체에서 검색
+        found = []
+        def enum_child_callback(child_hwnd, _):
+            if win32gui.GetClassName(child_hwnd) == CHROMIUM_RENDER_WIDGET_CLASS:
+                found.append(child_hwnd)
+                return False  # 찾으면 열거 중단
+            return True
+        try:
+            win32gui.EnumChildWindows(hwnd, enum_child_callback, None)
+        except Exception:
+            # 콜백에서 열거를 중단하면 pywin32가 오류를 낼 수 있음
+            pass
+        return found[0] if found else None
+    
     def _windows_refresh_tab(self, window_id, browser_type=None):
         """Windows에서 탭 새로고침"""
         if browser_type is None:
             browser_type = self.browser_type
         
         try:
-            # 창 목록에서 일치하는 ID 찾기
-            all_windows = gw.getAllWindows()
-            target_window = None
-            
-            for window in all_windows:
-                if window._hWnd == window_id:
-                    target_window = window
-                    break
+            # 창 핸들 캐시에서 일치하는 ID 찾기 (없으면 새로 연 창일 수 있으므로 한 번만 다시 조회)
+            target_window = self._get_hwnd_map().get(window_id)
+            if target_window is None:
+                target_window = self._get_hwnd_map(ttl=0).get(window_id)
             
             if target_window is None:
                 logger.warning(f"ID {window_id}인 창을 찾을 수 없습니다.")
                 return False
             
+            # Chromium 계열은 렌더링 자식 창에 F5 키 메시지를 직접 보냄 (창 활성화/대기 없이, 포커스도 빼앗지 않음)
+            # PostMessageW 성공은 메시지가 큐에 들어갔다는 뜻일 뿐이므로, 키 입력을 처리하는 창을 찾은 경우에만 사용
+            render_hwnd = None
+            if browser_type.lower() in ("chrome", "edge"):
+                render_hwnd = self._find_render_widget(window_id)
+            if render_hwnd:
+                if (user32.PostMessageW(render_hwnd, WM_KEYDOWN, VK_F5, F5_KEYDOWN_LPARAM)
+                        and user32.PostMessageW(render_hwnd, WM_KEYUP, VK_F5, F5_KEYUP_LPARAM)):
+                    # 메시지가 큐에 들어갔다는 뜻일 뿐이므로 새로고침 완료가 아닌 "전송됨"으로 보고
+                    logger.info(f"탭 '{target_window.title}' 새로고침 키 전송")
+                    return REFRESH_SENT
+                logger.warning(f"F5 메시지 전송 실패, 키 입력 방식으로 재시도: {target_window.title}")
+            else:
+                logger.debug(f"렌더링 창을 찾지 못해 키 입력 방식 사용: {target_window.title}")
+            
+            # pyautogui는 임포트 비용이 커서 실제로 키 입력이 필요할 때 로드
+            import pyautogui
+            
             # 창을 활성화하고 F5 키 입력 보내기
             try:
                 target_window.activate()
@@ -1045,12 +1295,7 @@ class TabManager:
         # 기타 브라우저(Chrome, Firefox, Edge) 처리
         try:
             # 브라우저 이름 결정
-            browser_names = {
-                "chrome": "Google Chrome",
-                "firefox": "Firefox",
-                "edge": "Microsoft Edge"
-            }
-            browser_name = browser_names.get(browser_type, "Google Chrome")
+            browser_name = MACOS_BROWSER_NAMES.get(browser_type, "Google Chrome")
             
             # 문자열 ID를 정수로 변환 (안전한 방식으로)
             try:
@@ -1061,12 +1306,8 @@ class TabManager:
             
             # 브라우저 실행 여부 확인
             if not browser_already_running:
-                check_script = f'''
-                tell application "System Events"
-                    set isRunning to exists process "{browser_name}"
-                end tell
-                '''
-                check_result = self._run_applescript(check_script, timeout=2)
+                check_result = self._run_applescript(MACOS_PROCESS_RUNNING_SCRIPT, timeout=2,
+                                                     args=(browser_name,))
                 
                 browser_running = check_result and "true" in check_result.lower()
                 if not browser_running:
@@ -1089,76 +1330,10 @@ class TabManager:
             # 새로고침 방법 1: 고급 AppleScript 시도 - 인덱스 기반 정밀 접근
             logger.info(f"[macOS] {browser_name} 탭({window_id}) 새로고침 시도 (방법 1)")
             
-            # 인덱스 기반 새로고침 (ID 기반보다 안정적)
-            access_script = f'''
-            tell application "{browser_name}"
-                set windowCount to count of windows
-                if windowCount is 0 then
-                    return "Error: No windows open"
-                end if
-                
-                set found to false
-                set window_index to 0
-                
-                # 먼저 ID로 창 찾기 시도
-                repeat with i from 1 to windowCount
-                    if id of window i is {window_id_int} then
-                        set window_index to i
-                        set found to true
-                        exit repeat
-                    end if
-                end repeat
-                
-                # ID로 찾지 못한 경우 창 ID가 숫자 체계를 따르는지 확인
-                if not found then
-                    # 창 ID가 2001, 3001 등의 패턴인 경우 해당 인덱스 사용
-                    if {window_id_int} > 1000 then
-                        set possible_index to {window_id_int} div 1000
-                        if possible_index <= windowCount then
-                            set window_index to possible_index
-                            set found to true
-                        end if
-                    end if
-                end if
-                
-                # 그래도 찾지 못한 경우 첫 번째 창 사용
-                if not found then
-                    set window_index to 1
-                end if
-                
-                # 탭 새로고침 수행
-                set tab_index to 1
-                if {window_id_int} mod 1000 > 0 then
-                    set tab_index to {window_id_int} mod 1000
-                end if
-                
-                try
-                    set total_tabs to count of tabs of window window_index
-                    if tab_index > total_tabs then
-                        set tab_index to 1
-                    end if
-                    
-                    tell window window_index
-                        # 새로고침할 탭 활성화 후 새로고침
-                        set active tab index to tab_index
-                        tell active tab to reload
-                    end tell
-                    
-                    return "Success: Tab refreshed. 창 " & windowCount & "개 발견. 창 인덱스 " & window_index & ", 탭 인덱스 " & tab_index & " 접근 시도."
-                on error errMsg
-                    # 오류 발생 시 단순 명령으로 시도
-                    activate
-                    tell application "System Events"
-                        tell process "{browser_name}"
-                            keystroke "r" using {{command down}}
-                        end tell
-                    end tell
-                    return "Success: Fallback refresh using keyboard command. Error: " & errMsg
-                end try
-            end tell
-            '''
+            # 인덱스 기반 새로고침 (ID 기반보다 안정적) - 미리 만든 스크립트에 창 ID만 인자로 전달
+            access_script = MACOS_REFRESH_SCRIPTS.get(browser_type, MACOS_REFRESH_SCRIPTS["chrome"])
             
-            access_result = self._run_applescript(access_script, timeout=5)
+            access_result = self._run_applescript(access_script, timeout=5, args=(window_id_int,))
             if access_result and "Success" in access_result:
                 logger.info(f"[macOS] AppleScript로 탭 새로고침 성공: {access_result}")
                 return True
@@ -1206,6 +1381,37 @@ class TabManager:
             logger.error(f"[macOS] 탭 새로고침 처리 중 예외 발생: {e}", exc_info=True)
             return False
     
+    def _macos_refresh_many(self, window_ids, browser_type):
+        """
+        macOS에서 같은 브라우저(Chrome/Edge)의 여러 탭을 AppleScript 한 번으로 새로고침
+        탭마다 osascript 프로세스를 띄우지 않도록 _macos_refresh_tab의 방법 1을 반복문으로 묶음
+        
+        Returns:
+            set: 새로고침에 성공한 탭 ID 집합 (나머지는 호출자가 탭별로 다시 시도)
+        """
+        batch_script = MACOS_REFRESH_MANY_SCRIPTS.get(browser_type)
+        ids_by_str = {}
+        for window_id in window_ids:
+            try:
+                ids_by_str[str(int(window_id))] = window_id
+            except (ValueError, TypeError):
+                continue  # 정수가 아닌 ID는 탭별 경로에서 처리
+        if batch_script is None or not ids_by_str:
+            return set()
+        
+        logger.info(f"[macOS] {MACOS_BROWSER_NAMES[browser_type]} 탭 {len(ids_by_str)}개 일괄 새로고침 시도")
+        # 스크립트는 argv를 앞에서부터 한 항목씩 처리하고 결과에 ID를 붙이므로, 요청 순서대로 ID 튜플을 넘김
+        argv = tuple(ids_by_str)
+        # 탭 수에 비례해 시간이 걸리므로 타임아웃도 늘림
+        batch_result = self._run_applescript(batch_script, timeout=5 + len(argv), args=argv)
+        refreshed = set()
+        for entry in (batch_result or "").split(","):
+            status, _, wid = entry.strip().partition(":")
+            if status == "OK" and wid in ids_by_str:
+                refreshed.add(ids_by_str[wid])
+        logger.info(f"[macOS] 일괄 새로고침 결과: {len(refreshed)}/{len(ids_by_str)}개 성공")
+        return refreshed
+    
     def _macos_refresh_safari_tab(self, window_id):
         """
         macOS에서 Safari 탭을 새로고침합니다.
@@ -1382,21 +1588,44 @@ class TabManager:
             return results
             
         try:
-            # 최대 작업자 수 결정 (기본값: 탭 수 또는 CPU 수 * 2 중 작은 값)
+            # 최대 작업자 수 결정 (기본값: 탭 수, CPU 수 * 2, 32 중 가장 작은 값)
             if max_workers is None:
-                import multiprocessing
-                max_workers = min(len(tab_ids), multiprocessing.cpu_count() * 2)
+                max_workers = min(len(tab_ids), (os.cpu_count() or 1) * 2, 32)
+            
+            # 결과마다 관리 목록을 다시 훑지 않도록 ID 색인 사용
+            tabs_by_id = self._tabs_by_id
+            
+            # Windows에서는 창 목록을 한 번만 열거하고 모든 작업자가 공유
+            if self.system == "Windows":
+                self._get_hwnd_map(ttl=0)
+            
+            # macOS에서는 Chrome/Edge 탭을 브라우저별로 AppleScript 한 번에 새로고침
+            batch_refreshed = set()
+            if self.system == "Darwin":
+                for browser_type, browser_tab_ids in self._group_tabs_by_browser_type(tab_ids).items():
+                    if browser_type in ("chrome", "edge") and len(browser_tab_ids) > 1:
+                        batch_refreshed |= self._macos_refresh_many(browser_tab_ids, browser_type)
             
             logger.info(f"병렬 새로고침 시작: {len(tab_ids)}개 탭, 최대 작업자 {max_workers}명")
             
             # 결과를 저장할 딕셔너리 (순서 유지를 위해)
             results_dict = {}
+            for tab_id in batch_refreshed:
+                tab = tabs_by_id.get(str(tab_id))
+                results_dict[tab_id] = {
+                    "id": tab_id,
+                    "name": tab.name if tab else f"탭 {tab_id}",
+                    "browser_type": (tab.browser_type or self.browser_type) if tab else self.browser_type,
+                    "success": True
+                }
             
             # 병렬 처리 시작
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # 각 탭 ID에 대한 새로고침 작업 제출
+                # (일괄 새로고침에 성공한 탭은 제외)
                 future_to_tab_id = {
-                    executor.submit(self.refresh_tab, tab_id): tab_id for tab_id in tab_ids
+                    executor.submit(self.refresh_tab, tab_id): tab_id
+                    for tab_id in tab_ids if tab_id not in batch_refreshed
                 }
                 
                 # 완료된 작업 결과 수집
@@ -1408,10 +1637,10 @@ class TabManager:
                         success = future.result()
                         
                         # 탭 정보 가져오기
-                        tab = self.get_tab_by_id(tab_id)
+                        tab = tabs_by_id.get(str(tab_id))
                         if tab:
-                            tab_name = tab["name"]
-                            browser_type = tab.get("browser_type", self.browser_type)
+                            tab_name = tab.name
+                            browser_type = tab.browser_type or self.browser_type
                         else:
                             # 탭 정보가 없으면 기본값 사용
                             tab_name = f"탭 {tab_id}"
@@ -1419,6 +1648,7 @@ class TabManager:
                         
                         # 결과 저장
                         results_dict[tab_id] = {
+                            "id": tab_id,
                             "name": tab_name,
                             "browser_type": browser_type,
                             "success": success
@@ -1433,6 +1663,7 @@ class TabManager:
                         logger.error(f"탭 ID {tab_id} 새로고침 중 오류: {exc}")
                         # 오류가 발생해도 결과 목록에 추가
                         results_dict[tab_id] = {
+                            "id": tab_id,
                             "name": f"탭 {tab_id}",
                             "browser_type": self.browser_type,
                             "success": False
@@ -1453,7 +1684,7 @@ class TabManager:
     def refresh_all_tabs(self):
         """모든 관리 탭 새로고침 - 병렬 처리 방식으로 변경"""
         # 모든 탭 ID 추출
-        tab_ids = [tab["id"] for tab in self.managed_tabs]
+        tab_ids = [tab.id for tab in self.managed_tabs]
         
         # 병렬 처리 함수 호출
         return self.refresh_tabs_parallel(tab_ids)
@@ -1461,7 +1692,9 @@ class TabManager:
     def set_browser_type(self, browser_type):
         """브라우저 타입 설정"""
         if browser_type.lower() in ["chrome", "firefox", "edge", "safari"]:
-            self.browser_type = browser_type.lower()
+            if self.browser_type != browser_type.lower():
+                self.browser_type = browser_type.lower()
+                self._dirty = True  # 예약 정보와 무관하므로 버전은 그대로
             logger.info(f"브라우저 타입을 {browser_type}로 변경했습니다.")
             return True
         return False
@@ -1507,20 +1740,20 @@ class TabManager:
         window_id_str = str(window_id)
         with self.tab_lock:
             # 이 창이 관리 목록에 있는지 확인
-            if any(tab["id"] == window_id for tab in self.managed_tabs):
+            if window_id_str in self._tabs_by_id:
                 # 기존 시간 확인 및 병합
-                existing_times = self.scheduled_refreshes.get(window_id_str, [])
-                if not isinstance(existing_times, list):
-                    existing_times = []
+                existing_times = self._tab_scheduled_refreshes.get(window_id_str, [])
+                # 스냅샷과 목록을 공유하므로 제자리 수정 대신 새 목록을 만들어 교체
+                existing_times = list(existing_times) if isinstance(existing_times, list) else []
                     
                 # 중복 제거 후 추가
                 for time_str in validated_times:
                     if time_str not in existing_times:
                         existing_times.append(time_str)
                 
-                self.scheduled_refreshes[window_id_str] = existing_times
+                self._tab_scheduled_refreshes[window_id_str] = existing_times
                 logger.info(f"창 {window_id}에 대한 예약 시간 추가 완료: {', '.join(validated_times)}")
-                self.save_tabs()
+                self._mark_changed()
                 return True
             else:
                 logger.warning(f"창 {window_id}가 존재하지 않아 예약 시간을 추가할 수 없습니다.")
@@ -1605,14 +1838,8 @@ class TabManager:
         window_id_str = str(window_id)
         changes_made = False
         
-        # 데드락 방지를 위해 락 패턴 개선
-        lock_acquired = False
-        try:
-            # 락 획득 시도 (타임아웃 설정)
-            lock_acquired = self.tab_lock.acquire(timeout=2.0)
-            if not lock_acquired:
-                logger.warning("시간 제거 중 락 획득 실패, 락 없이 진행합니다.")
-            
+        # 락 안에서는 작업용 사본만 수정하므로 파일 쓰기 등을 기다리지 않음
+        with self.tab_lock:
             # 내부 변수에 직접 작업
             if hasattr(self, '_tab_scheduled_refreshes'):
                 target_dict = self._tab_scheduled_refreshes
@@ -1646,8 +1873,11 @@ class TabManager:
                         logger.warning(f"창 {window_id}의 예약 시간 목록이 유효하지 않아 초기화됨")
                         changes_made = True
                     elif normalized_time in times:
-                        times.remove(normalized_time)
-                        if not times:  # 시간이 더 이상 없으면 키 자체를 제거
+                        # 스냅샷과 목록을 공유하므로 제자리 수정 대신 새 목록으로 교체
+                        times = [t for t in times if t != normalized_time]
+                        if times:
+                            target_dict[window_id_str] = times
+                        else:  # 시간이 더 이상 없으면 키 자체를 제거
                             target_dict.pop(window_id_str)
                         logger.info(f"창 {window_id}의 {normalized_time} 예약 새로고침이 제거되었습니다.")
                         changes_made = True
@@ -1655,18 +1885,12 @@ class TabManager:
                         logger.info(f"창 {window_id}에 제거할 시간 {normalized_time}이 존재하지 않습니다.")
             else:
                 logger.warning(f"창 {window_id}에 대한 예약 정보가 없습니다.")
-        finally:
-            # 락 해제 (획득했을 경우에만)
-            if lock_acquired:
-                self.tab_lock.release()
-        
-        # 변경사항이 있었을 경우에만 저장
-        if changes_made:
-            # 락을 이미 해제했으므로 save_tabs에서 락을 획득할 수 있음
-            self.save_tabs()
-            return True
+            
+            # 변경사항이 있었을 경우에만 기록 (스냅샷은 작업용 사본이 바뀌지 않도록 락 안에서 만듦)
+            if changes_made:
+                self._mark_changed()
         
-        return False
+        return changes_made
     
     def get_scheduled_refreshes(self, window_id=None):
         """예약된 새로고침 시간 조회
@@ -1705,6 +1929,107 @@ class TabManager:
                 valid_times.append(normalized)
         return valid_times
     
+    @staticmethod
+    def _parse_schedule_time(time_str):
+        """
+        저장된 시간 문자열('HH:MM', 'HH:MM:SS', 반복은 '*' 접두사)을 ScheduledTime으로 변환
+        형식이 잘못되었으면 None 반환
+        """
+        if not isinstance(time_str, str):
+            return None
+        repeating = time_str.startswith("*")
+        try:
+            parts = [int(p) for p in time_str[1 if repeating else 0:].split(":")]
+        except ValueError:
+            return None
+        if len(parts) not in (2, 3):
+            return None
+        h, m = parts[0], parts[1]
+        sec = parts[2] if len(parts) == 3 else 0
+        if not (0 <= h < 24 and 0 <= m < 60 and 0 <= sec < 60):
+            return None
+        has_seconds = len(parts) == 3
+        clock = f"{h:02d}:{m:02d}:{sec:02d}" if has_seconds else f"{h:02d}:{m:02d}"
+        return ScheduledTime(repeating, h * 3600 + m * 60 + sec, has_seconds, clock, time_str)
+    
+    def _get_schedule_index(self):
+        """
+        예약 시간을 한 번만 파싱하여 만든 색인 반환
+        예약 정보가 바뀔 때(schedule_version 증가)만 다시 만듦
+        
+        Returns:
+            tuple: (자정 기준 초 -> [(탭 ID 문자열, ScheduledTime)] (HH:MM:SS 항목),
+                    자정 기준 분 -> [(탭 ID 문자열, ScheduledTime)] (HH:MM 항목),
+                    정렬된 예약 시각(초) 목록,
+                    탭 ID 문자열 -> 표시 순서로 정렬된 [ScheduledTime])
+        """
+        cached_version, index = self._schedule_index_cache
+        if cached_version == self.schedule_version:
+            return index
+        
+        # 버전과 스냅샷을 락 안에서 함께 읽어 색인이 항상 자신이 만든 버전으로 저장되도록 함
+        # (_mark_changed는 tab_lock 안에서 스냅샷 교체와 버전 증가를 함께 수행)
+        with self.tab_lock:
+            version = self.schedule_version
+            schedules = self.scheduled_refreshes
+        
+        by_second = {}
+        by_minute = {}
+        by_tab = {}
+        unique_seconds = set()
+        for window_id_str, times in schedules.items():
+            # 유효한 시간 목록인지 확인
+            if not isinstance(times, list):
+                continue
+            tab_times = by_tab[window_id_str] = []
+            for time_str in times:
+                scheduled = self._parse_schedule_time(time_str)
+                if scheduled is None:
+                    continue
+                tab_times.append(scheduled)
+                # HH:MM 항목은 해당 분 전체, HH:MM:SS 항목은 그 초에만 일치
+                if scheduled.has_seconds:
+                    by_second.setdefault(scheduled.sec_of_day, []).append((window_id_str, scheduled))
+                else:
+                    by_minute.setdefault(scheduled.sec_of_day // 60, []).append((window_id_str, scheduled))
+                unique_seconds.add(scheduled.sec_of_day)
+        
+        for tab_times in by_tab.values():
+            tab_times.sort()
+        
+        index = (by_second, by_minute, sorted(unique_seconds), by_tab)
+        self._schedule_index_cache = (version, index)
+        return index
+    
+    def get_sorted_scheduled_times(self, window_id):
+        """
+        탭의 예약 시간을 일회성 먼저, 각각 시각순으로 정렬된 ScheduledTime 목록으로 반환
+        캐시된 색인을 그대로 돌려주므로 수정하지 말 것
+        """
+        return self._get_schedule_index()[3].get(str(window_id), [])
+    
+    def seconds_until_next_scheduled_refresh(self):
+        """
+        가장 가까운 예약 새로고침 시각까지 남은 시간(초) 계산
+        오늘 이미 지난 시간(현재 초 포함)은 다음 날 같은 시각으로 간주
+        
+        Returns:
+            float: 남은 시간(초), 예약된 시간이 없으면 None
+        """
+        if not self.scheduled_refreshes:
+            return None
+        seconds = self._get_schedule_index()[2]
+        if not seconds:
+            return None
+        
+        now = time.time()
+        local = time.localtime(now)
+        current = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec
+        # 정렬된 목록에서 현재 초 이후의 첫 시각을 이진 탐색
+        index = bisect.bisect_right(seconds, current)
+        nearest = seconds[index] if index < len(seconds) else seconds[0] + 24 * 3600
+        return nearest - current - (now % 1)
+    
     def check_scheduled_refreshes(self):
         """
         예약된 새로고침 시간이 현재 시간과 일치하는지 확인 후 새로고침 실행
@@ -1713,99 +2038,95 @@ class TabManager:
         Returns:
             list: 새로고침된 탭 ID 목록 반환
         """
+        # 예약이 하나도 없으면 시각 계산이나 색인 조회 없이 바로 종료
+        if not self.scheduled_refreshes:
+            return []
+        
         # 새로고침될 탭 ID 목록 초기화
         refreshed_tabs = []
-        tabs_to_refresh = []  # 병렬 처리를 위해 먼저 탭 ID들을 수집
+        # 병렬 처리를 위해 먼저 탭 ID들을 수집 (삽입 순서를 유지하는 dict로 중복 제거)
+        tabs_to_refresh = {}
         
-        # 현재 시간 가져오기
-        current_time = datetime.now()
-        current_time_hhmm = current_time.strftime("%H:%M")
-        current_time_hhmmss = current_time.strftime("%H:%M:%S")
+        # 현재 시간 가져오기 (자정 기준 초)
+        now = time.time()
+        epoch_sec = int(now)
+        if epoch_sec == self._last_schedule_check_sec:
+            # 같은 초에 다시 호출되면 이미 처리한 예약이므로 바로 종료
+            return refreshed_tabs
+        self._last_schedule_check_sec = epoch_sec
+        current_time = time.localtime(now)
+        current_sec = current_time.tm_hour * 3600 + current_time.tm_min * 60 + current_time.tm_sec
         
-        logger.info(f"예약된 새로고침 확인: 현재 시간 = {current_time_hhmmss}")
+        # 파싱된 색인에서 현재 초(HH:MM:SS 항목)와 현재 분(HH:MM 항목)을 정수 키로 조회
+        by_second, by_minute = self._get_schedule_index()[:2]
+        exact_matches = by_second.get(current_sec, ())
+        # HH:MM 항목은 그 분의 첫 확인에서만 실행 (같은 분에 초 단위 예약으로 다시 깨어나도 중복 실행 안 함)
+        current_minute = epoch_sec // 60
+        if current_minute == self._last_schedule_check_minute:
+            minute_matches = ()
+        else:
+            minute_matches = by_minute.get(current_sec // 60, ())
+            if minute_matches:
+                self._last_schedule_check_minute = current_minute
+        if not exact_matches and not minute_matches:
+            # 일치하는 예약이 없으면 목록을 만들거나 기록하지 않고 바로 종료
+            return refreshed_tabs
         
-        # 새로 고침된 탭 ID 추적을 위한 세트
-        processed_tabs = set()
+        logger.info(f"예약된 새로고침 확인: 현재 시간 = {time.strftime('%H:%M:%S', current_time)}")
         
         # 제거할 시간 항목 추적 (탭ID, 시간문자열)
         times_to_remove = []
         
-        # 모든 탭에 대한 예약 시간 확인
-        for window_id_str, times in self.scheduled_refreshes.items():
-            # 이미 처리된 탭은 건너뜀
-            if window_id_str in processed_tabs:
-                continue
-                
-            # 유효한 시간 목록인지 확인
-            if not isinstance(times, list) or not times:
-                continue
-                
-            for time_str in times:
-                # 문자열 형식인지 확인
-                if not isinstance(time_str, str):
-                    continue
-                    
-                # 반복 시간인지 확인 (별표로 시작하는 경우)
-                is_repeating = time_str.startswith("*")
-                # 실제 비교할 시간 문자열 준비
-                compare_time_str = time_str[1:] if is_repeating else time_str
-                
-                # 정확한 시간 비교를 위해 초까지 확인
-                if len(compare_time_str) == 5:  # HH:MM 형식인 경우
-                    compare_time = compare_time_str
-                    current_compare = current_time_hhmm
-                else:  # HH:MM:SS 형식인 경우
-                    compare_time = compare_time_str[:8]  # 최대 8자까지 (HH:MM:SS)
-                    current_compare = current_time_hhmmss
-                
-                # 정확히 시간이 일치할 때만 새로고침
-                if compare_time == current_compare:
-                    logger.info(f"정확히 일치하는 시간 발견: 탭={window_id_str}, 시간={time_str}")
-                    
-                    try:
-                        # 문자열 ID를 숫자로 변환 (안전하게)
-                        try:
-                            tab_id = int(window_id_str)
-                        except ValueError:
-                            tab_id = window_id_str
-                        
-                        # 새로고침할 탭 목록에 추가 (중복 방지)
-                        if tab_id not in tabs_to_refresh:
-                            tabs_to_refresh.append(tab_id)
-                            processed_tabs.add(window_id_str)
-                        
-                            # 일회성 시간인 경우 제거 목록에 추가
-                            if not is_repeating:
-                                times_to_remove.append((window_id_str, time_str))
-                                logger.info(f"일회성 시간 {time_str}은 실행 후 제거될 예정")
-                    except Exception as e:
-                        logger.error(f"탭 {window_id_str} 처리 중 오류: {e}")
+        for window_id_str, scheduled in itertools.chain(exact_matches, minute_matches):
+            time_str = scheduled.text
+            logger.info(f"정확히 일치하는 시간 발견: 탭={window_id_str}, 시간={time_str}")
+            
+            # 문자열 ID를 숫자로 변환 (안전하게)
+            try:
+                tab_id = int(window_id_str)
+            except ValueError:
+                tab_id = window_id_str
+            
+            # 관리 목록에서 제거된 탭의 예약은 새로고침하지 않음
+            if window_id_str in self._tabs_by_id:
+                # 새로고침할 탭 목록에 추가 (중복 방지)
+                tabs_to_refresh[tab_id] = None
+            else:
+                logger.warning(f"관리 목록에 없는 탭의 예약 건너뜀: 탭={window_id_str}")
+            
+            # 일회성 시간인 경우 제거 목록에 추가
+            if not scheduled.repeating:
+                times_to_remove.append((window_id_str, time_str))
+                logger.info(f"일회성 시간 {time_str}은 실행 후 제거될 예정")
         
         # 병렬로 일괄 새로고침 실행
         if tabs_to_refresh:
             logger.info(f"예약된 새로고침 실행: {len(tabs_to_refresh)}개 탭 병렬 처리")
             
             # 결과 수집 (성공한 탭만 반환)
-            results = self.refresh_tabs_parallel(tabs_to_refresh)
-            for i, result in enumerate(results):
+            results = self.refresh_tabs_parallel(list(tabs_to_refresh))
+            # 결과에 탭 ID가 포함되어 있으므로 위치 대응 없이 한 번만 순회
+            for result in results:
                 if result.get("success", False):
-                    refreshed_tabs.append(tabs_to_refresh[i])
-            
-            # 일회성 시간 제거
-            if times_to_remove:
-                with self.tab_lock:  # 스레드 안전성 보장
-                    for window_id_str, time_str in times_to_remove:
-                        if window_id_str in self.scheduled_refreshes and time_str in self.scheduled_refreshes[window_id_str]:
-                            self.scheduled_refreshes[window_id_str].remove(time_str)
-                            logger.info(f"일회성 시간 제거됨: 탭={window_id_str}, 시간={time_str}")
-                            
-                            # 시간 목록이 비었으면 키 자체를 제거
-                            if not self.scheduled_refreshes[window_id_str]:
-                                self.scheduled_refreshes.pop(window_id_str)
-                                logger.info(f"시간 목록이 비어 탭 제거됨: {window_id_str}")
+                    refreshed_tabs.append(result["id"])
+        
+        # 일회성 시간 제거 (관리 목록에 없어 건너뛴 탭의 예약 포함)
+        if times_to_remove:
+            with self.tab_lock:  # 스레드 안전성 보장
+                for window_id_str, time_str in times_to_remove:
+                    schedules = self._tab_scheduled_refreshes
+                    if window_id_str in schedules and time_str in schedules[window_id_str]:
+                        # 스냅샷과 목록을 공유하므로 제자리 수정 대신 새 목록으로 교체
+                        schedules[window_id_str] = [t for t in schedules[window_id_str] if t != time_str]
+                        logger.info(f"일회성 시간 제거됨: 탭={window_id_str}, 시간={time_str}")
+                        
+                        # 시간 목록이 비었으면 키 자체를 제거
+                        if not schedules[window_id_str]:
+                            schedules.pop(window_id_str)
+                            logger.info(f"시간 목록이 비어 탭 제거됨: {window_id_str}")
                 
-                # 변경사항 저장
-                self.save_tabs()
+                # 변경사항 기록
+                self._mark_changed()
         
         return refreshed_tabs
     
@@ -1902,10 +2223,9 @@ class TabManager:
     
     def _get_tab_browser_type(self, tab_id):
         """탭 ID에 해당하는 브라우저 타입 반환"""
-        tab_id_str = str(tab_id)
-        for tab in self.managed_tabs:
-            if str(tab["id"]) == tab_id_str:
-                return tab.get("browser_type", self.browser_type).lower()
+        tab = self._tabs_by_id.get(str(tab_id))
+        if tab is not None:
+            return (tab.browser_type or self.browser_type).lower()
         
         # 기본값 반환 (ID 패턴에 따라 브라우저 타입 추측)
         if tab_id >= 1000:
@@ -1964,13 +2284,12 @@ class TabManager:
             
             # 이미 존재하는지 확인 후 추가
             if normalized_time not in existing_times:
-                existing_times.append(normalized_time)
-                self._tab_scheduled_refreshes[str_tab_id] = existing_times
-                self.scheduled_refreshes = self._tab_scheduled_refreshes.copy()
+                # 스냅샷과 목록을 공유하므로 제자리 수정 대신 새 목록으로 교체
+                self._tab_scheduled_refreshes[str_tab_id] = [*existing_times, normalized_time]
                 logger.info(f"탭 ID {tab_id}에 시간 {normalized_time} 추가됨")
                 
-                # 변경사항 저장
-                self.save_tabs()
+                # 변경사항 기록
+                self._mark_changed()
                 return True
             else:
                 logger.info(f"시간 {normalized_time}은 이미 탭 ID {tab_id}에 존재함")
@@ -1982,19 +2301,14 @@ class TabManager:
         with self.tab_lock:  # 스레드 안전성 보장
             changes_made = False
             
-            # 기본 scheduled_refreshes에서 제거
-            if tab_id_str in self.scheduled_refreshes:
-                self.scheduled_refreshes.pop(tab_id_str)
-                changes_made = True
-            
-            # 내부 변수 _tab_scheduled_refreshes에서도 제거
+            # 작업용 사본에서 제거 (스냅샷은 _mark_changed에서 새로 만듦)
             if hasattr(self, '_tab_scheduled_refreshes') and tab_id_str in self._tab_scheduled_refreshes:
                 self._tab_scheduled_refreshes.pop(tab_id_str)
                 changes_made = True
             
             if changes_made:
                 logger.info(f"탭 {tab_id}의 모든 새로고침 시간이 제거됨")
-                self.save_tabs()
+                self._mark_changed()
                 return True
             
             logger.info(f"탭 {tab_id}에 제거할 새로고침 시간이 없음")
@@ -2007,10 +2321,6 @@ class TabManager:
         with self.tab_lock:  # 스레드 안전성 보장
             if enabled:
                 # 이미 등록된 시간이 없는 경우, 빈 목록으로 초기화
-                if tab_id_str not in self.scheduled_refreshes:
-                    self.scheduled_refreshes[tab_id_str] = []
-                
-                # 내부 변수도 함께 업데이트
                 if hasattr(self, '_tab_scheduled_refreshes'):
                     if tab_id_str not in self._tab_scheduled_refreshes:
                         self._tab_scheduled_refreshes[tab_id_str] = []
@@ -2018,14 +2328,10 @@ class TabManager:
                     self._tab_scheduled_refreshes = {tab_id_str: []}
             else:
                 # 예약 해제 시 모든 시간 제거
-                if tab_id_str in self.scheduled_refreshes:
-                    self.scheduled_refreshes.pop(tab_id_str)
-                
-                # 내부 변수도 함께 업데이트
                 if hasattr(self, '_tab_scheduled_refreshes') and tab_id_str in self._tab_scheduled_refreshes:
                     self._tab_scheduled_refreshes.pop(tab_id_str)
             
-            self.save_tabs()
+            self._mark_changed()
             logger.info(f"탭 {tab_id}의 예약 새로고침 상태가 {enabled}로 설정됨")
             return True
     
@@ -2039,11 +2345,7 @@ class TabManager:
         Returns:
             해당하는 탭 정보 딕셔너리, 찾지 못한 경우 None
         """
-        tab_id_str = str(tab_id)
-        for tab in self.managed_tabs:
-            if str(tab["id"]) == tab_id_str:
-                return tab
-        return None
+        return self._tabs_by_id.get(str(tab_id))
         
     def _save_tab_scheduled_refreshes(self):
         """
@@ -2051,10 +2353,10 @@ class TabManager:
         내부 _tab_scheduled_refreshes 값을 scheduled_refreshes로 동기화합니다.
         """
         try:
-            # 간단히 save_tabs 호출 (save_tabs에서 동기화 처리)
-            # 별도의 락 관리나 동기화 로직 없이 save_tabs에 위임
-            self.save_tabs()
-            logger.debug("예약된 새로고침 시간이 저장되었습니다.")
+            # 동기화는 _mark_changed에서 처리하고, 파일 쓰기는 다음 save_tabs에서 수행
+            with self.tab_lock:
+                self._mark_changed()
+            logger.debug("예약된 새로고침 시간 변경이 기록되었습니다.")
         except Exception as e:
             logger.error(f"예약된 새로고침 시간 저장 중 오류: {e}", exc_info=True)
 
@@ -2085,7 +2387,7 @@ if __name__ == "__main__":
         # 현재 관리 중인 탭 표시
         print("\n관리 중인 탭 목록:")
         for tab in tab_manager.managed_tabs:
-            print(f"  - {tab['name']} (ID: {tab['id']})")
+            print(f"  - {tab.name} (ID: {tab.id})")
         
         # 예약된 새로고침 목록 표시
         print("\n예약된 새로고침 목록:")
@@ -0,0 +1,31 @@
+import types
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from gui import MainWindow
+from tab_manager import TabManager
+
+
+def test_scheduled_times_text_reuses_cached_text():
+    tab_manager = TabManager({
+        "managed_tabs": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        "scheduled_refreshes": {"1": ["10:00:00", "*09:00"], "2": ["10:00:00"]},
+    })
+    calls = []
+    original = tab_manager.get_sorted_scheduled_times
+
+    def counting(tab_id):
+        calls.append(tab_id)
+        return original(tab_id)
+
+    tab_manager.get_sorted_scheduled_times = counting
+    window = types.SimpleNamespace(tab_manager=tab_manager, _scheduled_text_cache={})
+
+    first = MainWindow._scheduled_times_text(window, (1, 2))
+    second = MainWindow._scheduled_times_text(window, (1, 2))
+
+    assert first == second == "10:00:00, * 09:00 (매일)"
+    # 두 번째 호출은 캐시에서 바로 반환되어 예약 목록을 다시 조회하지 않음
+    assert calls == [1, 2]
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+import tab_manager
+from tab_manager import TabManager, extract_tab_name
+
+# 2023-12-09 00:00:00 UTC (테스트에서는 localtime 대신 gmtime을 사용하여 시간대와 무관하게 만듦)
+MIDNIGHT = 86400 * 19700
+
+
+def at(hour, minute, second=0, day=0):
+    """MIDNIGHT 기준 day일 뒤 hh:mm:ss의 epoch 초"""
+    return MIDNIGHT + day * 86400 + hour * 3600 + minute * 60 + second
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.time/time.localtime을 고정된 UTC 시각으로 대체 (clock.now를 바꿔 시간 이동)"""
+    class Clock:
+        now = float(MIDNIGHT)
+
+    monkeypatch.setattr(tab_manager.time, "time", lambda: Clock.now)
+    monkeypatch.setattr(tab_manager.time, "localtime",
+                        lambda secs=None: time.gmtime(Clock.now if secs is None else secs))
+    return Clock
+
+
+def make_manager(schedules, tab_info_file=None):
+    manager = TabManager({
+        "managed_tabs": [{"id": int(tab_id), "name": f"tab {tab_id}"} for tab_id in schedules],
+        "scheduled_refreshes": schedules,
+    }, tab_info_file=tab_info_file)
+    manager.refreshed = []
+
+    def refresh_tabs_parallel(tab_ids, max_workers=None):
+        manager.refreshed.extend(tab_ids)
+        return [{"id": tab_id, "name": f"tab {tab_id}", "browser_type": "chrome", "success": True}
+                for tab_id in tab_ids]
+
+    manager.refresh_tabs_parallel = refresh_tabs_parallel
+    return manager
+
+
+def test_extract_tab_name_strips_only_trailing_browser_name():
+    assert extract_tab_name("GitHub - Google Chrome") == "GitHub"
+    assert extract_tab_name("Foo - Edge cases - Google Chrome") == "Foo - Edge cases"
+    assert extract_tab_name("Chrome tips - Safari") == "Chrome tips"
+    assert extract_tab_name("Docs - Mozilla Firefox") == "Docs"
+
+
+def test_check_scheduled_refreshes_runs_once_per_second(clock):
+    manager = make_manager({"1": ["*10:00:05"]})
+
+    clock.now = at(10, 0, 5) + 0.1
+    assert manager.check_scheduled_refreshes() == [1]
+    clock.now = at(10, 0, 5) + 0.9
+    assert manager.check_scheduled_refreshes() == []
+
+    assert manager.refreshed == [1]
+
+
+def test_check_scheduled_refreshes_runs_minute_entries_once_per_minute(clock):
+    manager = make_manager({"1": ["*10:00"], "2": ["*10:00:30"]})
+
+    clock.now = at(10, 0, 0)
+    assert manager.check_scheduled_refreshes() == [1]
+    # 같은 분에 초 단위 예약으로 다시 깨어나도 HH:MM 항목은 다시 실행하지 않음
+    clock.now = at(10, 0, 30)
+    assert manager.check_scheduled_refreshes() == [2]
+    # 다음 날 같은 분에는 다시 실행
+    clock.now = at(10, 0, 0, day=1)
+    assert manager.check_scheduled_refreshes() == [1]
+
+    assert manager.refreshed == [1, 2, 1]
+
+
+def test_check_scheduled_refreshes_removes_one_time_entries(clock):
+    manager = make_manager({"1": ["10:00:05", "*10:00:05"]})
+
+    clock.now = at(10, 0, 5)
+    assert manager.check_scheduled_refreshes() == [1]
+
+    assert manager.scheduled_refreshes == {"1": ["*10:00:05"]}
+
+
+def test_clean_past_scheduled_times_keeps_repeating_entries(clock):
+    manager = make_manager({"1": ["09:00", "*09:00", "13:00:00"], "2": ["08:00:00"], "3": ["*07:00"]})
+
+    clock.now = at(12, 0)
+    manager._clean_past_scheduled_times()
+
+    assert manager.scheduled_refreshes == {"1": ["*09:00", "13:00:00"], "3": ["*07:00"]}
+
+
+def test_seconds_until_next_scheduled_refresh_crosses_midnight(clock):
+    manager = make_manager({"1": ["00:00:10"]})
+
+    clock.now = at(23, 59, 50) + 0.25
+    assert manager.seconds_until_next_scheduled_refresh() == pytest.approx(19.75)
+
+
+def test_seconds_until_next_scheduled_refresh_treats_current_second_as_past(clock):
+    manager = make_manager({"1": ["*23:59:50"]})
+
+    clock.now = at(23, 59, 50) + 0.25
+    assert manager.seconds_until_next_scheduled_refresh() == pytest.approx(86400 - 0.25)
+
+
+def test_save_tabs_skips_write_when_content_is_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / "tab_handles.json")
+    manager = make_manager({"1": ["*10:00"]}, tab_info_file=path)
+    manager._mark_changed()
+    assert manager.save_tabs()
+    with open(path, "rb") as f:
+        saved = f.read()
+
+    replaced = []
+    monkeypatch.setattr(tab_manager.os, "replace", lambda *args: replaced.append(args))
+
+    # 변경 표시만 되고 내용이 같으면 파일을 다시 쓰지 않음
+    manager._mark_changed()
+    assert manager.save_tabs()
+    # 파일에서 로드한 경우에도 로드한 내용의 해시로 비교
+    loaded = TabManager(tab_info_file=path)
+    loaded._mark_changed()
+    assert loaded.save_tabs()
+
+    assert replaced == []
+    assert not (tmp_path / "tab_handles.json.tmp").exists()
+    with open(path, "rb") as f:
+        assert f.read() == saved
@@ -1,16 +1,19 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QListWidget, QListWidgetItem, QPushButton, QGroupBox,
                              QTimeEdit, QCheckBox)
-from PySide6.QtCore import QTime
+from PySide6.QtCore import QTime, Slot
 import re
 
 class TimeScheduleDialog(QDialog):
     def __init__(self, parent=None, current_times=None):
         super().__init__(parent)
         self.setWindowTitle("새로고침 시간 설정")
-        self.times = [] if current_times is None else current_times.copy()
+        # 중복 검사를 상수 시간에 하도록 집합으로 보관 (반복 시간은 '*' 접두사 포함)
         # 유효한 시간 문자열만 필터링
-        self.times = [t for t in self.times if isinstance(t, str) and self._validate_time_format(t)]
+        self.times = {t for t in (current_times or [])
+                      if isinstance(t, str) and self._validate_time_format(t.lstrip("*"))}
+        # 목록에 표시된 순서 그대로의 정렬 결과 (시간이 바뀔 때만 다시 정렬)
+        self._sorted_times = []
         self.init_ui()
     
     def init_ui(self):
@@ -103,30 +106,20 @@ class TimeScheduleDialog(QDialog):
     
     def update_time_list(self):
         """시간 목록 업데이트"""
-        self.time_list.clear()
-        # 유효한 시간만 표시
-        valid_times = []
-        for time_item in self.times:
+        # 정렬은 목록이 바뀔 때 한 번만 수행하고 결과를 재사용
+        self._sorted_times = self.get_times()
+        
+        display_times = []
+        for time_item in self._sorted_times:
             # '*'로 시작하는 경우 반복 실행 시간으로 처리
-            is_repeating = False
-            display_time = time_item
-            check_time = time_item
-            
-            if isinstance(time_item, str) and time_item.startswith("*"):
-                is_repeating = True
-                check_time = time_item[1:]  # '*' 제거하여 검증
-                display_time = f"* {check_time} (매일 반복)"
-            
-            if isinstance(check_time, str) and self._validate_time_format(check_time):
-                valid_times.append(time_item)  # 원래 형식으로 저장
-                item = QListWidgetItem(display_time)
-                self.time_list.addItem(item)
+            if time_item.startswith("*"):
+                display_times.append(f"* {time_item[1:]} (매일 반복)")
             else:
-                print(f"경고: 올바르지 않은 시간 형식 무시됨: {time_item}")
+                display_times.append(time_item)
         
-        # 유효하지 않은 항목이 있으면 times 리스트 업데이트
-        if len(valid_times) != len(self.times):
-            self.times = valid_times
+        # 항목을 한 번에 추가
+        self.time_list.clear()
+        self.time_list.addItems(display_times)
         
         # 상태 레이블 업데이트
         self.update_status()
@@ -155,6 +148,7 @@ class TimeScheduleDialog(QDialog):
         except ValueError:
             return False
     
+    @Slot()
     def add_time(self, time_str=None, repeating=None):
         """
         새로운 시간 추가
@@ -227,7 +221,7 @@ class TimeScheduleDialog(QDialog):
         
         # 중복 검사 - 정규화된 시간으로 비교
         if final_time not in self.times:
-            self.times.append(final_time)
+            self.times.add(final_time)
             print(f"시간이 성공적으로 추가됨: {final_time}")
             self.update_time_list()  # 목록과 상태 업데이트
             return True
@@ -237,6 +231,7 @@ class TimeScheduleDialog(QDialog):
             print(f"중복된 시간: {final_time}")
             return False
     
+    @Slot()
     def remove_selected_times(self):
         """선택한 시간 삭제"""
         selected_items = self.time_list.selectedItems()
@@ -252,16 +247,17 @@ class TimeScheduleDialog(QDialog):
             # 표시 텍스트에서 실제 시간 추출
             # 두 가지 형식 처리: "* HH:MM:SS (매일 반복)" 또는 일반 "HH:MM:SS"
             index = self.time_list.row(item)
-            if index < len(self.times):
-                time_str = self.times[index]
+            if index < len(self._sorted_times):
+                time_str = self._sorted_times[index]
                 if time_str in self.times:
-                    self.times.remove(time_str)
+                    self.times.discard(time_str)
                     removed_times.append(display_text)
         
         self.update_time_list()
         if hasattr(self, 'status_label') and self.status_label is not None:
             self.status_label.setText(f"삭제된 시간: {', '.join(removed_times)}")
     
+    @Slot()
     def clear_all_times(self):
         """모든 시간 삭제"""
         if not self.times:
@@ -281,7 +277,7 @@ class TimeScheduleDialog(QDialog):
         
         if self.times:
             # 일반 항목과 반복 항목 개수 계산
-            repeat_count = sum(1 for t in self.times if isinstance(t, str) and t.startswith("*"))
+            repeat_count = sum(1 for t in self.times if t.startswith("*"))
             normal_count = len(self.times) - repeat_count
             
             status_text = f"설정된 시간: {len(self.times)}개"
@@ -294,16 +290,8 @@ class TimeScheduleDialog(QDialog):
     
     def get_times(self):
         """설정된 시간 목록 반환"""
-        # 일반 항목과 반복 항목을 분리하여 정렬 후 다시 결합
-        normal_times = [t for t in self.times if not (isinstance(t, str) and t.startswith("*"))]
-        repeat_times = [t for t in self.times if isinstance(t, str) and t.startswith("*")]
-        
-        # 각각 정렬
-        normal_times.sort()
-        repeat_times.sort()
-        
-        # 결합: 일반 항목 먼저, 그 다음 반복 항목
-        return normal_times + repeat_times
+        # 일반 항목 먼저, 그 다음 반복 항목 - 각각 시간순 정렬
+        return sorted(self.times, key=lambda t: (t.startswith("*"), t))
     
     def get_times_with_repeat(self):
         """
@@ -313,15 +301,12 @@ class TimeScheduleDialog(QDialog):
             list: 각 시간을 딕셔너리 형태로 담은 목록, 예: [{'time': '12:00', 'repeating': True}, {'time': '15:30', 'repeating': False}]
         """
         result = []
-        for time_str in self.times:
-            if isinstance(time_str, str):
-                is_repeating = time_str.startswith('*')
-                actual_time = time_str[1:] if is_repeating else time_str
-                
-                if self._validate_time_format(actual_time):
-                    result.append({
-                        'time': actual_time,
-                        'repeating': is_repeating
-                    })
+        for time_str in self.get_times():
+            is_repeating = time_str.startswith('*')
+            actual_time = time_str[1:] if is_repeating else time_str
+            result.append({
+                'time': actual_time,
+                'repeating': is_repeating
+            })
         
         return result 
\ No newline at end of file